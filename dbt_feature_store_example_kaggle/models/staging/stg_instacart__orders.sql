@@ -1,3 +1,10 @@
+{{
+    config(
+        materialized='table',
+        cluster_by=['eval_set', 'order_id']
+    )
+}}
+
 with source as (
     select * from {{ source('instacart_raw', 'ORDERS') }}
 ),
@@ -0,0 +1,2 @@
+select * from {{ ref('stg_instacart__orders') }}
+where eval_set = 'train'
@@ -13,6 +13,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'snowflake_feature_store/config.py'),
                                                 'snowflake_feature_store.config.FeatureViewConfig.from_yaml': ( 'config.html#featureviewconfig.from_yaml',
                                                                                                                 'snowflake_feature_store/config.py'),
+                                                'snowflake_feature_store.config.FeatureViewConfig.from_yaml_unchecked': ( 'config.html#featureviewconfig.from_yaml_unchecked',
+                                                                                                                          'snowflake_feature_store/config.py'),
                                                 'snowflake_feature_store.config.FeatureViewConfig.full_name': ( 'config.html#featureviewconfig.full_name',
                                                                                                                 'snowflake_feature_store/config.py'),
                                                 'snowflake_feature_store.config.FeatureViewConfig.refresh_frequency': ( 'config.html#featureviewconfig.refresh_frequency',
@@ -24,13 +26,27 @@ d = { 'settings': { 'branch': 'main',
                                                 'snowflake_feature_store.config.RefreshConfig': ( 'config.html#refreshconfig',
                                                                                                   'snowflake_feature_store/config.py'),
                                                 'snowflake_feature_store.config.RefreshConfig.validate_frequency': ( 'config.html#refreshconfig.validate_frequency',
-                                                                                                                     'snowflake_feature_store/config.py')},
+                                                                                                                     'snowflake_feature_store/config.py'),
+                                                'snowflake_feature_store.config._format_full_name': ( 'config.html#_format_full_name',
+                                                                                                      'snowflake_feature_store/config.py'),
+                                                'snowflake_feature_store.config._format_version': ( 'config.html#_format_version',
+                                                                                                    'snowflake_feature_store/config.py')},
             'snowflake_feature_store.connection': { 'snowflake_feature_store.connection.ConnectionConfig': ( 'connection.html#connectionconfig',
                                                                                                              'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.ConnectionConfig._from_env_cached': ( 'connection.html#connectionconfig._from_env_cached',
+                                                                                                                              'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.ConnectionConfig._from_yaml_cached': ( 'connection.html#connectionconfig._from_yaml_cached',
+                                                                                                                               'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.ConnectionConfig.auth_params': ( 'connection.html#connectionconfig.auth_params',
+                                                                                                                         'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.ConnectionConfig.clear_cache': ( 'connection.html#connectionconfig.clear_cache',
+                                                                                                                         'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.ConnectionConfig.from_env': ( 'connection.html#connectionconfig.from_env',
                                                                                                                       'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.ConnectionConfig.from_yaml': ( 'connection.html#connectionconfig.from_yaml',
                                                                                                                        'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.ConnectionConfig.private_key_der': ( 'connection.html#connectionconfig.private_key_der',
+                                                                                                                             'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.SnowflakeConnection': ( 'connection.html#snowflakeconnection',
                                                                                                                 'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.SnowflakeConnection.__enter__': ( 'connection.html#snowflakeconnection.__enter__',
@@ -39,8 +55,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                          'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.SnowflakeConnection.__init__': ( 'connection.html#snowflakeconnection.__init__',
                                                                                                                          'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._build_session': ( 'connection.html#snowflakeconnection._build_session',
+                                                                                                                               'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._cache_session': ( 'connection.html#snowflakeconnection._cache_session',
+                                                                                                                               'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._close_pooled': ( 'connection.html#snowflakeconnection._close_pooled',
+                                                                                                                              'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._create_session': ( 'connection.html#snowflakeconnection._create_session',
+                                                                                                                                'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._get_cached_session': ( 'connection.html#snowflakeconnection._get_cached_session',
+                                                                                                                                    'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._resolve_session_key': ( 'connection.html#snowflakeconnection._resolve_session_key',
+                                                                                                                                     'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._retire_cached': ( 'connection.html#snowflakeconnection._retire_cached',
+                                                                                                                               'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._session_config': ( 'connection.html#snowflakeconnection._session_config',
+                                                                                                                                'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection._set_cte_optimization': ( 'connection.html#snowflakeconnection._set_cte_optimization',
+                                                                                                                                      'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.SnowflakeConnection.close': ( 'connection.html#snowflakeconnection.close',
                                                                                                                       'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection.database': ( 'connection.html#snowflakeconnection.database',
+                                                                                                                         'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.SnowflakeConnection.execute_query': ( 'connection.html#snowflakeconnection.execute_query',
                                                                                                                               'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.SnowflakeConnection.from_config': ( 'connection.html#snowflakeconnection.from_config',
@@ -51,8 +87,46 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                           'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.SnowflakeConnection.get_session': ( 'connection.html#snowflakeconnection.get_session',
                                                                                                                             'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection.pooled_session': ( 'connection.html#snowflakeconnection.pooled_session',
+                                                                                                                               'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection.role': ( 'connection.html#snowflakeconnection.role',
+                                                                                                                     'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection.schema': ( 'connection.html#snowflakeconnection.schema',
+                                                                                                                       'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.SnowflakeConnection.test_connection': ( 'connection.html#snowflakeconnection.test_connection',
                                                                                                                                 'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection.SnowflakeConnection.warehouse': ( 'connection.html#snowflakeconnection.warehouse',
+                                                                                                                          'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._apply_context': ( 'connection.html#_apply_context',
+                                                                                                           'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._apply_env_overrides': ( 'connection.html#_apply_env_overrides',
+                                                                                                                 'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._auth_params': ( 'connection.html#_auth_params',
+                                                                                                         'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._context_statements': ( 'connection.html#_context_statements',
+                                                                                                                'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._der_private_key': ( 'connection.html#_der_private_key',
+                                                                                                             'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._ensured_keys': ( 'connection.html#_ensured_keys',
+                                                                                                          'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._ensured_objects': ( 'connection.html#_ensured_objects',
+                                                                                                             'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._forget_ensured': ( 'connection.html#_forget_ensured',
+                                                                                                            'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._identifier': ( 'connection.html#_identifier',
+                                                                                                        'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._is_transient': ( 'connection.html#_is_transient',
+                                                                                                          'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._mark_ensured': ( 'connection.html#_mark_ensured',
+                                                                                                          'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._normalize_identifier': ( 'connection.html#_normalize_identifier',
+                                                                                                                  'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._read_env': ( 'connection.html#_read_env',
+                                                                                                      'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._run_statements': ( 'connection.html#_run_statements',
+                                                                                                            'snowflake_feature_store/connection.py'),
+                                                    'snowflake_feature_store.connection._same_identifier': ( 'connection.html#_same_identifier',
+                                                                                                             'snowflake_feature_store/connection.py'),
                                                     'snowflake_feature_store.connection.get_connection': ( 'connection.html#get_connection',
                                                                                                            'snowflake_feature_store/connection.py')},
             'snowflake_feature_store.core': { 'snowflake_feature_store.core.FeatureStoreDefaults': ( 'core.html#featurestoredefaults',
@@ -63,11 +137,17 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                  'snowflake_feature_store/core.py'),
                                               'snowflake_feature_store.core.SQLFormatter.format_sql': ( 'core.html#sqlformatter.format_sql',
                                                                                                         'snowflake_feature_store/core.py'),
+                                              'snowflake_feature_store.core._format_sql': ( 'core.html#_format_sql',
+                                                                                            'snowflake_feature_store/core.py'),
+                                              'snowflake_feature_store.core._parse_sql': ( 'core.html#_parse_sql',
+                                                                                           'snowflake_feature_store/core.py'),
                                               'snowflake_feature_store.core.create_feature_view_name': ( 'core.html#create_feature_view_name',
                                                                                                          'snowflake_feature_store/core.py'),
                                               'snowflake_feature_store.core.create_version': ( 'core.html#create_version',
                                                                                                'snowflake_feature_store/core.py')},
-            'snowflake_feature_store.examples': { 'snowflake_feature_store.examples.create_feature_configs': ( 'example_functions.html#create_feature_configs',
+            'snowflake_feature_store.examples': { 'snowflake_feature_store.examples._demo_columns': ( 'example_functions.html#_demo_columns',
+                                                                                                      'snowflake_feature_store/examples.py'),
+                                                  'snowflake_feature_store.examples.create_feature_configs': ( 'example_functions.html#create_feature_configs',
                                                                                                                'snowflake_feature_store/examples.py'),
                                                   'snowflake_feature_store.examples.generate_demo_data': ( 'example_functions.html#generate_demo_data',
                                                                                                            'snowflake_feature_store/examples.py'),
@@ -93,31 +173,59 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                         'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureMonitor._verify_column_names': ( 'feature_view.html#featuremonitor._verify_column_names',
                                                                                                                                     'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.FeatureMonitor.agg_exprs': ( 'feature_view.html#featuremonitor.agg_exprs',
+                                                                                                                         'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureMonitor.compute_stats': ( 'feature_view.html#featuremonitor.compute_stats',
                                                                                                                              'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureMonitor.detect_drift': ( 'feature_view.html#featuremonitor.detect_drift',
                                                                                                                             'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureMonitor.set_baseline': ( 'feature_view.html#featuremonitor.set_baseline',
                                                                                                                             'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.FeatureMonitor.stats_from_row': ( 'feature_view.html#featuremonitor.stats_from_row',
+                                                                                                                              'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.FeatureMonitor.violation_exprs': ( 'feature_view.html#featuremonitor.violation_exprs',
+                                                                                                                               'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.FeatureMonitor.violation_message': ( 'feature_view.html#featuremonitor.violation_message',
+                                                                                                                                 'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureStats': ( 'feature_view.html#featurestats',
                                                                                                              'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureStats.__str__': ( 'feature_view.html#featurestats.__str__',
                                                                                                                      'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.FeatureStats._formatted': ( 'feature_view.html#featurestats._formatted',
+                                                                                                                        'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureStats.model_dump': ( 'feature_view.html#featurestats.model_dump',
                                                                                                                         'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureViewBuilder': ( 'feature_view.html#featureviewbuilder',
                                                                                                                    'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureViewBuilder.__init__': ( 'feature_view.html#featureviewbuilder.__init__',
                                                                                                                             'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.FeatureViewBuilder._aggregate_stats': ( 'feature_view.html#featureviewbuilder._aggregate_stats',
+                                                                                                                                    'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.FeatureViewBuilder._save_stats': ( 'feature_view.html#featureviewbuilder._save_stats',
+                                                                                                                               'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureViewBuilder._validate_features': ( 'feature_view.html#featureviewbuilder._validate_features',
                                                                                                                                       'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureViewBuilder._validate_timestamp_col': ( 'feature_view.html#featureviewbuilder._validate_timestamp_col',
                                                                                                                                            'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.FeatureViewBuilder.build': ( 'feature_view.html#featureviewbuilder.build',
                                                                                                                          'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.FeatureViewBuilder.feature_stats': ( 'feature_view.html#featureviewbuilder.feature_stats',
+                                                                                                                                 'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view._batch_agg_exprs': ( 'feature_view.html#_batch_agg_exprs',
+                                                                                                                 'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view._optional_float': ( 'feature_view.html#_optional_float',
+                                                                                                                'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view._stat_array': ( 'feature_view.html#_stat_array',
+                                                                                                            'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.compute_stats_batch': ( 'feature_view.html#compute_stats_batch',
+                                                                                                                    'snowflake_feature_store/feature_view.py'),
                                                       'snowflake_feature_store.feature_view.create_feature_view': ( 'feature_view.html#create_feature_view',
-                                                                                                                    'snowflake_feature_store/feature_view.py')},
-            'snowflake_feature_store.logging': { 'snowflake_feature_store.logging.setup_logger': ( 'logging.html#setup_logger',
+                                                                                                                    'snowflake_feature_store/feature_view.py'),
+                                                      'snowflake_feature_store.feature_view.detect_drift_batch': ( 'feature_view.html#detect_drift_batch',
+                                                                                                                   'snowflake_feature_store/feature_view.py')},
+            'snowflake_feature_store.logging': { 'snowflake_feature_store.logging._stop_listeners': ( 'logging.html#_stop_listeners',
+                                                                                                      'snowflake_feature_store/logging.py'),
+                                                 'snowflake_feature_store.logging.setup_logger': ( 'logging.html#setup_logger',
                                                                                                    'snowflake_feature_store/logging.py')},
             'snowflake_feature_store.manager': { 'snowflake_feature_store.manager.FeatureStoreCallback': ( 'manager.html#featurestorecallback',
                                                                                                            'snowflake_feature_store/manager.py'),
@@ -133,16 +241,42 @@ d = { 'settings': { 'branch': 'main',
                                                                                                           'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.FeatureStoreManager.__init__': ( 'manager.html#featurestoremanager.__init__',
                                                                                                                    'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager._compute_stats': ( 'manager.html#featurestoremanager._compute_stats',
+                                                                                                                         'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager._compute_stats_per_feature': ( 'manager.html#featurestoremanager._compute_stats_per_feature',
+                                                                                                                                     'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager._descendants': ( 'manager.html#featurestoremanager._descendants',
+                                                                                                                       'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager._notify_error': ( 'manager.html#featurestoremanager._notify_error',
+                                                                                                                        'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager._rebuild_dispatch': ( 'manager.html#featurestoremanager._rebuild_dispatch',
+                                                                                                                            'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.FeatureStoreManager._update_dependencies': ( 'manager.html#featurestoremanager._update_dependencies',
                                                                                                                                'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.FeatureStoreManager._validate_schema': ( 'manager.html#featurestoremanager._validate_schema',
                                                                                                                            'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager._view_from_config': ( 'manager.html#featurestoremanager._view_from_config',
+                                                                                                                            'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager._view_from_ref': ( 'manager.html#featurestoremanager._view_from_ref',
+                                                                                                                         'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager.add_callback': ( 'manager.html#featurestoremanager.add_callback',
+                                                                                                                       'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.FeatureStoreManager.add_entity': ( 'manager.html#featurestoremanager.add_entity',
                                                                                                                      'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.FeatureStoreManager.add_feature_view': ( 'manager.html#featurestoremanager.add_feature_view',
                                                                                                                            'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager.callbacks': ( 'manager.html#featurestoremanager.callbacks',
+                                                                                                                    'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.FeatureStoreManager.check_feature_drift': ( 'manager.html#featurestoremanager.check_feature_drift',
                                                                                                                               'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager.feature_configs': ( 'manager.html#featurestoremanager.feature_configs',
+                                                                                                                          'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager.feature_stats': ( 'manager.html#featurestoremanager.feature_stats',
+                                                                                                                        'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager.feature_transforms': ( 'manager.html#featurestoremanager.feature_transforms',
+                                                                                                                             'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.FeatureStoreManager.feature_views': ( 'manager.html#featurestoremanager.feature_views',
+                                                                                                                        'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.FeatureStoreManager.get_feature_dependencies': ( 'manager.html#featurestoremanager.get_feature_dependencies',
                                                                                                                                    'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.FeatureStoreManager.get_features': ( 'manager.html#featurestoremanager.get_features',
@@ -153,6 +287,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.MetricsCallback._save_metrics': ( 'manager.html#metricscallback._save_metrics',
                                                                                                                     'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.MetricsCallback.begin_batch': ( 'manager.html#metricscallback.begin_batch',
+                                                                                                                  'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager.MetricsCallback.end_batch': ( 'manager.html#metricscallback.end_batch',
+                                                                                                                'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.MetricsCallback.on_drift_detected': ( 'manager.html#metricscallback.on_drift_detected',
                                                                                                                         'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.MetricsCallback.on_entity_create': ( 'manager.html#metricscallback.on_entity_create',
@@ -161,6 +299,34 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.MetricsCallback.on_feature_view_create': ( 'manager.html#metricscallback.on_feature_view_create',
                                                                                                                              'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._FeatureViewState': ( 'manager.html#_featureviewstate',
+                                                                                                        'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._ViewField': ( 'manager.html#_viewfield',
+                                                                                                 'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._ViewField.__delitem__': ( 'manager.html#_viewfield.__delitem__',
+                                                                                                             'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._ViewField.__getitem__': ( 'manager.html#_viewfield.__getitem__',
+                                                                                                             'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._ViewField.__init__': ( 'manager.html#_viewfield.__init__',
+                                                                                                          'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._ViewField.__iter__': ( 'manager.html#_viewfield.__iter__',
+                                                                                                          'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._ViewField.__len__': ( 'manager.html#_viewfield.__len__',
+                                                                                                         'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._ViewField.__repr__': ( 'manager.html#_viewfield.__repr__',
+                                                                                                          'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._ViewField.__setitem__': ( 'manager.html#_viewfield.__setitem__',
+                                                                                                             'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._batched_callbacks': ( 'manager.html#_batched_callbacks',
+                                                                                                         'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._dump_json': ( 'manager.html#_dump_json',
+                                                                                                 'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._json_default': ( 'manager.html#_json_default',
+                                                                                                    'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._quote': ( 'manager.html#_quote',
+                                                                                             'snowflake_feature_store/manager.py'),
+                                                 'snowflake_feature_store.manager._short_id': ( 'manager.html#_short_id',
+                                                                                                'snowflake_feature_store/manager.py'),
                                                  'snowflake_feature_store.manager.feature_store_session': ( 'manager.html#feature_store_session',
                                                                                                             'snowflake_feature_store/manager.py')},
             'snowflake_feature_store.transforms': { 'snowflake_feature_store.transforms.CumulativeAggTransform': ( 'transforms.html#cumulativeaggtransform',
@@ -5,11 +5,19 @@
 # %% ../nbs/01_config.ipynb 2
 from __future__ import annotations
 from typing import Optional, Dict, List, Union
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import timedelta
+from functools import lru_cache
+import re
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml C extension when available
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 # Import our custom exceptions
 from .exceptions import ConfigurationError
 
@@ -18,6 +26,9 @@ from .exceptions import ConfigurationError
 __all__ = ['RefreshConfig', 'FeatureValidationConfig', 'FeatureConfig', 'FeatureViewConfig']
 
 # %% ../nbs/01_config.ipynb 3
+_CRON_PATTERN = re.compile(r"^\s*\S+(\s+\S+){4}\s*$")
+_DURATION_PATTERN = re.compile(r"^\s*[+-]?\d+\s+(minutes?|hours?|days?)\s*$", re.IGNORECASE)
+
 class RefreshConfig(BaseModel):
     """Configuration for feature refresh settings"""
     frequency: str = Field("1 day", description="Refresh frequency (e.g., '1 day', '30 minutes')")
@@ -27,33 +38,19 @@ class RefreshConfig(BaseModel):
     @classmethod
     def validate_frequency(cls, v):
         """Validate refresh frequency format"""
-        try:
-            # Check if it's a cron expression
-            if ' ' in v and len(v.split()) == 5:
-                return v
-            
-            # Parse as time duration
-            parts = v.split()
-            if len(parts) != 2:
-                raise ValueError
-            
-            num = int(parts[0])
-            unit = parts[1].lower()
-            
-            valid_units = ['minute', 'minutes', 'hour', 'hours', 'day', 'days']
-            if unit not in valid_units:
-                raise ValueError
-                
+        # Accept either a cron expression or a time duration
+        if _CRON_PATTERN.match(v) or _DURATION_PATTERN.match(v):
             return v
-        except ValueError:
-            raise ConfigurationError(
-                f"Invalid refresh frequency: {v}. "
-                "Use either cron expression or duration (e.g., '1 day', '30 minutes')"
-            )
+        raise ConfigurationError(
+            f"Invalid refresh frequency: {v}. "
+            "Use either cron expression or duration (e.g., '1 day', '30 minutes')"
+        )
 
-# %% ../nbs/01_config.ipynb 4
+# %% ../nbs/01_config.ipynb 5
 class FeatureValidationConfig(BaseModel):
     """Configuration for feature validation rules"""
+    model_config = ConfigDict(frozen=True)
+    
     null_check: bool = Field(True, description="Check for null values")
     null_threshold: float = Field(0.1, description="Maximum allowed null ratio")
     range_check: bool = Field(False, description="Check value ranges")
@@ -63,13 +60,19 @@ class FeatureValidationConfig(BaseModel):
     unique_threshold: float = Field(0.9, description="Minimum unique ratio")
 
 
-# %% ../nbs/01_config.ipynb 5
+# Frozen, so features without explicit rules can all share one instance
+_DEFAULT_VALIDATION = FeatureValidationConfig()
+
+
+# %% ../nbs/01_config.ipynb 6
 class FeatureConfig(BaseModel):
     """Configuration for individual features"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     description: str
     validation: Optional[FeatureValidationConfig] = Field(
-        default_factory=FeatureValidationConfig,
+        default=_DEFAULT_VALIDATION,
         description="Validation rules for this feature"
     )
     dependencies: List[str] = Field(
@@ -78,7 +81,21 @@ class FeatureConfig(BaseModel):
     )
 
 
-# %% ../nbs/01_config.ipynb 6
+# %% ../nbs/01_config.ipynb 7
+@lru_cache(maxsize=1024)
+def _format_version(major_version: int, minor_version: int) -> str:
+    return f"V{major_version}_{minor_version}"
+
+
+@lru_cache(maxsize=1024)
+def _format_full_name(domain: str, entity: str, feature_type: str) -> str:
+    parts = ["FV"]
+    if domain:
+        parts.append(domain)
+    parts.extend([entity, feature_type])
+    return "_".join(part.upper() for part in parts)
+
+
 class FeatureViewConfig(BaseModel):
     """Enhanced configuration for feature views"""
     name: str
@@ -99,16 +116,12 @@ class FeatureViewConfig(BaseModel):
     @property
     def version(self) -> str:
         """Get formatted version string"""
-        return f"V{self.major_version}_{self.minor_version}"
+        return _format_version(self.major_version, self.minor_version)
 
     @property
     def full_name(self) -> str:
         """Get formatted full name for the feature view"""
-        parts = ["FV"]
-        if self.domain:
-            parts.append(self.domain)
-        parts.extend([self.entity, self.feature_type])
-        return "_".join(part.upper() for part in parts)
+        return _format_full_name(self.domain, self.entity, self.feature_type)
     
     @property
     def refresh_frequency(self) -> str:
@@ -119,17 +132,41 @@ class FeatureViewConfig(BaseModel):
     def from_yaml(cls, path: Union[str, Path]) -> FeatureViewConfig:
         """Load configuration from YAML file"""
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=YamlLoader)
             return cls(**data)
         except Exception as e:
             raise ConfigurationError(f"Error loading config from {path}: {str(e)}")
 
+    @classmethod
+    def from_yaml_unchecked(cls, path: Union[str, Path]) -> FeatureViewConfig:
+        """Load configuration from a trusted YAML file without validation
+        
+        Only use this for files written by `to_yaml`, which were validated
+        when the config was built. Nested models are constructed the same way.
+        """
+        try:
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=YamlLoader)
+            if isinstance(data.get('refresh'), dict):
+                data['refresh'] = RefreshConfig.model_construct(**data['refresh'])
+            features = {}
+            for name, feature in (data.get('features') or {}).items():
+                if isinstance(feature.get('validation'), dict):
+                    feature['validation'] = FeatureValidationConfig.model_construct(
+                        **feature['validation']
+                    )
+                features[name] = FeatureConfig.model_construct(**feature)
+            data['features'] = features
+            return cls.model_construct(**data)
+        except Exception as e:
+            raise ConfigurationError(f"Error loading config from {path}: {str(e)}")
+
     def to_yaml(self, path: Union[str, Path]) -> None:
         """Save configuration to YAML file"""
         try:
             with open(path, 'w') as f:
-                yaml.dump(self.model_dump(), f)
+                yaml.dump(self.model_dump(), f, Dumper=YamlDumper)
         except Exception as e:
             raise ConfigurationError(f"Error saving config to {path}: {str(e)}")
 
@@ -4,23 +4,30 @@
 
 # %% ../nbs/05_connection.ipynb 2
 from __future__ import annotations
-from typing import Optional, Dict, Any, Tuple, Union
+from typing import Optional, Dict, Any, List, Tuple, Union, Iterator
 from snowflake.snowpark import Session
 from snowflake.snowpark.exceptions import SnowparkSessionException
 from snowflake.snowpark.context import get_active_session
+from snowflake.connector.errors import InterfaceError, OperationalError
 import os
+import re
+import time
+import queue
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 import yaml
-from tenacity import retry, stop_after_attempt, wait_exponential
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 import warnings
 
 # Import our new modules
 from .exceptions import ConnectionError, ConfigurationError
 from .logging import logger
-from .config import BaseModel, Field
+from .config import BaseModel, Field, YamlLoader
 
 # Suppress the specific Pydantic warning about schema
 warnings.filterwarnings("ignore", message="Field name \"schema\" .* shadows an attribute in parent \"BaseModel\"")
@@ -29,6 +36,92 @@ warnings.filterwarnings("ignore", message="Field name \"schema\" .* shadows an a
 __all__ = ['ConnectionConfig', 'SnowflakeConnection', 'get_connection']
 
 # %% ../nbs/05_connection.ipynb 3
+# SNOWFLAKE_* environment variables and the config fields they set
+_ENV_VARS: Tuple[Tuple[str, str], ...] = (
+    ('SNOWFLAKE_ACCOUNT', 'account'),
+    ('SNOWFLAKE_USER', 'user'),
+    ('SNOWFLAKE_PASSWORD', 'password'),
+    ('SNOWFLAKE_ROLE', 'role'),
+    ('SNOWFLAKE_WAREHOUSE', 'warehouse'),
+    ('SNOWFLAKE_DATABASE', 'database'),
+    ('SNOWFLAKE_SCHEMA', 'schema'),
+    ('SNOWFLAKE_PRIVATE_KEY_PATH', 'private_key_path'),
+    ('SNOWFLAKE_AUTHENTICATOR', 'authenticator'),
+)
+
+def _read_env() -> Tuple[Optional[str], ...]:
+    """Snapshot the SNOWFLAKE_* variables (used as a cache key)"""
+    return tuple(os.environ.get(env_var) for env_var, _ in _ENV_VARS)
+
+def _apply_env_overrides(
+    config: Dict[str, Any], env: Optional[Tuple[Optional[str], ...]] = None
+) -> Dict[str, Any]:
+    """Overlay set SNOWFLAKE_* values onto a config dict
+    
+    Args:
+        config: Config dict to update in place
+        env: Snapshot from `_read_env`; the live environment is read if omitted
+        
+    Returns:
+        The updated config dict
+    """
+    if env is None:
+        env = _read_env()
+    for (_, config_key), value in zip(_ENV_VARS, env):
+        if value:
+            config[config_key] = value
+    return config
+
+@lru_cache(maxsize=16)
+def _der_private_key(key_path: Optional[str], key_pem: Optional[str]) -> bytes:
+    """Decode a PEM private key into the DER/PKCS8 bytes Snowpark expects (cached)"""
+    # Imported here so password and active-session users never load cryptography
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.backends import default_backend
+    
+    if key_pem:
+        key_data = key_pem.encode()
+    else:
+        with open(key_path, "rb") as key_file:
+            key_data = key_file.read()
+            
+    p_key = serialization.load_pem_private_key(
+        key_data,
+        password=None,
+        backend=default_backend()
+    )
+    return p_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+
+@lru_cache(maxsize=16)
+def _auth_params(
+    account: str,
+    user: str,
+    authenticator: Optional[str],
+    key_path: Optional[str],
+    key_pem: Optional[str],
+    password: Optional[str]
+) -> Tuple[Tuple[str, Any], ...]:
+    """Resolve the account, user and credential parameters for a session (cached)"""
+    params = [("account", account), ("user", user)]
+    
+    # Select authentication method
+    if authenticator:
+        params.append(("authenticator", authenticator))
+    elif key_path or key_pem:
+        params.append(("private_key", _der_private_key(key_path, key_pem)))
+    elif password:
+        params.append(("password", password))
+    else:
+        raise ConnectionError(
+            "No authentication method provided. Please provide either "
+            "authenticator, private_key, or password."
+        )
+    return tuple(params)
+
 class ConnectionConfig(BaseModel):
     """Configuration for Snowflake connection"""
     user: str
@@ -42,27 +135,44 @@ class ConnectionConfig(BaseModel):
     private_key_pem: Optional[str] = None
     authenticator: Optional[str] = None
     query_tag: Optional[Dict[str, Any]] = None
+    cte_optimization: bool = Field(True, description="Enable Snowpark CTE optimization")
+    
+    @property
+    def private_key_der(self) -> Optional[bytes]:
+        """DER-encoded private key, decoded once per key source"""
+        if not (self.private_key_pem or self.private_key_path):
+            return None
+        key_path = str(self.private_key_path) if self.private_key_path else None
+        return _der_private_key(key_path, self.private_key_pem)
+    
+    @property
+    def auth_params(self) -> Dict[str, Any]:
+        """Account, user and credentials shared by every session from this config
+        
+        Resolved once per distinct set of credentials; each call returns a
+        fresh dict that is safe to extend with per-session context.
+        """
+        key_path = str(self.private_key_path) if self.private_key_path else None
+        return dict(_auth_params(
+            self.account, self.user, self.authenticator,
+            key_path, self.private_key_pem, self.password
+        ))
     
     @classmethod
     def from_env(cls) -> ConnectionConfig:
-        """Create connection config from environment variables"""
+        """Create connection config from environment variables
+        
+        Validated configs are cached per distinct set of SNOWFLAKE_* values.
+        """
+        # Hand out a copy so callers can override fields without touching the cache
+        return cls._from_env_cached(_read_env()).model_copy()
+    
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _from_env_cached(cls, env: Tuple[Optional[str], ...]) -> ConnectionConfig:
+        """Validate the environment config (cached)"""
         try:
-            config = {}
-            env_vars = {
-                'SNOWFLAKE_ACCOUNT': 'account',
-                'SNOWFLAKE_USER': 'user',
-                'SNOWFLAKE_PASSWORD': 'password',
-                'SNOWFLAKE_ROLE': 'role',
-                'SNOWFLAKE_WAREHOUSE': 'warehouse',
-                'SNOWFLAKE_DATABASE': 'database',
-                'SNOWFLAKE_SCHEMA': 'schema',
-                'SNOWFLAKE_PRIVATE_KEY_PATH': 'private_key_path',
-                'SNOWFLAKE_AUTHENTICATOR': 'authenticator'
-            }
-
-            for env_var, config_key in env_vars.items():
-                if value := os.getenv(env_var):
-                    config[config_key] = value
+            config = _apply_env_overrides({}, env)
                     
             # Ensure required fields are present
             if 'account' not in config:
@@ -81,32 +191,42 @@ class ConnectionConfig(BaseModel):
                 raise ConfigurationError(f"Error creating connection config from environment: {str(e)}")
             raise
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached configs so the next load re-reads its source"""
+        cls._from_env_cached.cache_clear()
+        cls._from_yaml_cached.cache_clear()
+        _der_private_key.cache_clear()
+        _auth_params.cache_clear()
+    
     @classmethod
     def from_yaml(cls, path: Union[str, Path]) -> ConnectionConfig:
-        """Create connection config from YAML file"""
+        """Create connection config from YAML file
+        
+        Parsed configs are cached by path, file modification time and the
+        SNOWFLAKE_* overrides, so an edited file is picked up automatically.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError as e:
+            raise ConfigurationError(f"Error loading config from {path}: {str(e)}")
+        return cls._from_yaml_cached(str(path), mtime, _read_env()).model_copy()
+    
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _from_yaml_cached(
+        cls, path: str, mtime: int, env: Tuple[Optional[str], ...]
+    ) -> ConnectionConfig:
+        """Parse and validate a YAML config (cached)"""
         try:
-            with open(path) as f:
-                yaml_config = yaml.safe_load(f)
+            with open(path, "rb") as f:
+                yaml_config = yaml.load(f, Loader=YamlLoader)
                 
             # Support both top-level config and nested under 'snowflake' key
             config = yaml_config.get('snowflake', yaml_config)
             
             # Environment variables override YAML
-            env_vars = {
-                'SNOWFLAKE_ACCOUNT': 'account',
-                'SNOWFLAKE_USER': 'user',
-                'SNOWFLAKE_PASSWORD': 'password',
-                'SNOWFLAKE_ROLE': 'role',
-                'SNOWFLAKE_WAREHOUSE': 'warehouse',
-                'SNOWFLAKE_DATABASE': 'database',
-                'SNOWFLAKE_SCHEMA': 'schema',
-                'SNOWFLAKE_PRIVATE_KEY_PATH': 'private_key_path',
-                'SNOWFLAKE_AUTHENTICATOR': 'authenticator'
-            }
-
-            for env_var, config_key in env_vars.items():
-                if value := os.getenv(env_var):
-                    config[config_key] = value
+            _apply_env_overrides(config, env)
                     
             return cls(**config)
         except Exception as e:
@@ -114,14 +234,31 @@ class ConnectionConfig(BaseModel):
 
 
 # %% ../nbs/05_connection.ipynb 4
+# Errors worth retrying: dropped connections and network failures. SQL errors
+# (syntax, missing objects, permissions) fail the same way every time.
+_TRANSIENT_ERRORS = (OperationalError, InterfaceError, SnowparkSessionException, OSError)
+
+def _is_transient(e: BaseException) -> bool:
+    """Whether a failed query is worth retrying"""
+    return isinstance(e.__cause__, _TRANSIENT_ERRORS)
+
+# Cache key for sessions: (user, role, warehouse, database, schema)
+_SessionKey = Tuple[str, str, str, str, str]
+
 class SnowflakeConnection:
     """Manages Snowflake connection and configuration"""
+    health_check_ttl: float = 30.0  # Seconds a successful connection test stays valid
+    health_check_timeout: int = 5  # Statement timeout for the connection test ping
+    
     def __init__(self, 
                  session: Session,
                  warehouse: Optional[str] = None,
                  database: Optional[str] = None,
                  schema: Optional[str] = None,
-                 config: Optional[ConnectionConfig] = None):
+                 config: Optional[ConnectionConfig] = None,
+                 max_cached_sessions: int = 8,
+                 session_ttl: float = 3 * 60 * 60,
+                 max_pool_size: int = 4):
         """Initialize Snowflake connection
         
         Args:
@@ -130,66 +267,127 @@ class SnowflakeConnection:
             database: Override default database
             schema: Override default schema
             config: Original connection configuration (for caching)
+            max_cached_sessions: Maximum number of cached sessions kept open
+            session_ttl: Seconds before a cached session is recreated
+                (kept under Snowflake's 4 hour token lifetime)
+            max_pool_size: Maximum sessions per context handed out by `pooled_session`
         """
         self.session = session
-        self.warehouse = warehouse or session.get_current_warehouse()
-        self.database = database or session.get_current_database()
-        self.schema = schema or session.get_current_schema()
+        
+        self._set_cte_optimization(session, config.cte_optimization if config else True)
+            
+        # Explicit values skip the round trip; missing ones are fetched lazily
+        if config:
+            self.role = config.role
+        if warehouse:
+            self.warehouse = warehouse
+        if database:
+            self.database = database
+        if schema:
+            self.schema = schema
         self._config = config
-        self._session_cache: Dict[Tuple[str, str, str], Session] = {}
+        self._last_ok_ts = 0.0
+        self.max_cached_sessions = max_cached_sessions
+        self.session_ttl = session_ttl
+        # LRU order: least recently used first, entries are (session, created_at)
+        self._session_cache: OrderedDict[_SessionKey, Tuple[Session, float]] = OrderedDict()
+        # Guards every read and write of _session_cache (lookups reorder it too)
+        self._cache_lock = threading.RLock()
+        # Sessions dropped from the cache; callers may still hold them, so
+        # they're only closed by close(close_all=True)
+        self._retired_sessions: weakref.WeakSet = weakref.WeakSet()
+        # One creator per key: threads missing the same key wait on its lock
+        self._creating: Dict[_SessionKey, threading.Lock] = {}
+        # Exclusive checkout pools: idle (session, created_at) entries plus a slot
+        # limit per context, and the sessions currently checked out
+        self.max_pool_size = max_pool_size
+        self._pools: Dict[_SessionKey, queue.LifoQueue] = {}
+        self._pool_slots: Dict[_SessionKey, threading.BoundedSemaphore] = {}
+        self._checked_out: set = set()
         
         # Add the initial session to the cache if config is provided
         if config and self.database:
-            cache_key = (config.role, self.warehouse, self.database)
-            self._session_cache[cache_key] = session
+            cache_key = (config.user, config.role, self.warehouse, self.database, self.schema)
+            self._cache_session(cache_key, session)
             
-        logger.info(f"Initialized connection to {self.database}.{self.schema}")
+        # Only log what was passed in; reading the lazy properties here would
+        # issue the round trips they exist to avoid
+        logger.info("Initialized connection to %s.%s", database or "<session>", schema or "<session>")
+    
+    @cached_property
+    def role(self) -> Optional[str]:
+        """Current role, fetched from the session on first access"""
+        return self.session.get_current_role()
+    
+    @cached_property
+    def warehouse(self) -> Optional[str]:
+        """Current warehouse, fetched from the session on first access"""
+        return self.session.get_current_warehouse()
+    
+    @cached_property
+    def database(self) -> Optional[str]:
+        """Current database, fetched from the session on first access"""
+        return self.session.get_current_database()
+    
+    @cached_property
+    def schema(self) -> Optional[str]:
+        """Current schema, fetched from the session on first access"""
+        return self.session.get_current_schema()
         
+    def _retire_cached(self, session: Session) -> None:
+        """Forget an evicted session without closing it
+        
+        `get_session` shares cached sessions, so another caller may still be
+        using this one. It's closed with the rest by `close(close_all=True)`.
+        """
+        if session is not self.session:
+            self._retired_sessions.add(session)
+    
+    def _get_cached_session(self, cache_key: _SessionKey) -> Optional[Session]:
+        """Return a live cached session, dropping it if it outlived the TTL"""
+        entry = self._session_cache.get(cache_key)
+        if entry is None:
+            return None
+        session, created_at = entry
+        if time.monotonic() - created_at > self.session_ttl:
+            del self._session_cache[cache_key]
+            self._retire_cached(session)
+            logger.info(f"Cached session for {cache_key} expired")
+            return None
+        self._session_cache.move_to_end(cache_key)
+        return session
+    
+    def _cache_session(self, cache_key: _SessionKey, session: Session) -> None:
+        """Cache a session, evicting the least recently used ones over capacity"""
+        self._session_cache[cache_key] = (session, time.monotonic())
+        self._session_cache.move_to_end(cache_key)
+        while len(self._session_cache) > self.max_cached_sessions:
+            evicted_key, (evicted, _) = self._session_cache.popitem(last=False)
+            self._retire_cached(evicted)
+            logger.info(f"Evicted cached session for {evicted_key}")
+        
+    @staticmethod
+    def _set_cte_optimization(session: Session, enabled: bool) -> None:
+        """Let Snowpark deduplicate repeated DataFrame references into CTEs"""
+        try:
+            session.cte_optimization_enabled = enabled
+        except AttributeError:
+            logger.debug("CTE optimization not supported by this Snowpark version")
+    
     @classmethod
-    def from_config(cls, config: ConnectionConfig) -> SnowflakeConnection:
-        """Create connection from config object"""
+    def _build_session(cls, config: ConnectionConfig) -> Session:
+        """Open a Snowpark session for a config without wrapping it in a connection"""
         try:
-            # Prepare connection parameters
-            params = {
-                "account": config.account,
-                "user": config.user,
-                "role": config.role,
-                "warehouse": config.warehouse,
-            }
-
-            if config.database:
-                params["database"] = config.database
-            if config.schema:
-                params["schema"] = config.schema
-            
-            # Select authentication method
-            if config.authenticator:
-                params["authenticator"] = config.authenticator
-            elif config.private_key_path or config.private_key_pem:
-                # Load and format private key
-                if config.private_key_pem:
-                    key_data = config.private_key_pem.encode()
-                elif config.private_key_path:
-                    with open(config.private_key_path, "rb") as key_file:
-                        key_data = key_file.read()
-                        
-                p_key = serialization.load_pem_private_key(
-                    key_data,
-                    password=None,
-                    backend=default_backend()
-                )
-                params["private_key"] = p_key.private_bytes(
-                    encoding=serialization.Encoding.DER,
-                    format=serialization.PrivateFormat.PKCS8,
-                    encryption_algorithm=serialization.NoEncryption()
-                )
-            elif config.password:
-                params["password"] = config.password
-            else:
-                raise ConnectionError(
-                    "No authentication method provided. Please provide either "
-                    "authenticator, private_key, or password."
-                )
+            # Shared credentials plus whichever parts of this session's context are set
+            params = config.auth_params
+            params.update(
+                (key, value) for key, value in (
+                    ("role", config.role),
+                    ("warehouse", config.warehouse),
+                    ("database", config.database),
+                    ("schema", config.schema),
+                ) if value
+            )
 
             # Create session
             session = Session.builder.configs(params).create()
@@ -197,11 +395,23 @@ class SnowflakeConnection:
             # Set query tag if provided
             if config.query_tag:
                 session.query_tag = config.query_tag
-                
-            return cls(session, config=config)
+            cls._set_cte_optimization(session, config.cte_optimization)
+            
+            return session
         except Exception as e:
             raise ConnectionError(f"Failed to create session: {str(e)}")
     
+    @classmethod
+    def from_config(cls, config: ConnectionConfig) -> SnowflakeConnection:
+        """Create connection from config object"""
+        return cls(
+            cls._build_session(config),
+            warehouse=config.warehouse,
+            database=config.database,
+            schema=config.schema,
+            config=config
+        )
+    
     @classmethod
     def from_env(cls) -> SnowflakeConnection:
         """Create connection from environment variables"""
@@ -232,68 +442,195 @@ class SnowflakeConnection:
         Returns:
             A Snowflake session
         """
-        # Use existing config or create minimal one based on current connection
-        config = self._config or ConnectionConfig(
-            user=self.session.get_current_user(),
-            account=self.session.get_current_account(),
-            role=role or self.session.get_current_role(),
-            warehouse=warehouse or self.warehouse,
-            database=database or self.database,
-            schema=schema or self.schema
-        )
+        config, cache_key = self._resolve_session_key(role, warehouse, database, schema)
+        if not use_cache:
+            return self._create_session(config, cache_key)
         
-        final_role = role or config.role
-        final_warehouse = warehouse or self.warehouse
-        final_database = database or self.database
-        
-        if use_cache:
-            cache_key = (final_role, final_warehouse, final_database)
-            if cache_key in self._session_cache:
-                session = self._session_cache[cache_key]
-                if schema:
-                    session.use_schema(schema)
+        # The full context is part of the key, so a cached session is already
+        # in the requested schema and needs no USE SCHEMA round trip
+        with self._cache_lock:
+            session = self._get_cached_session(cache_key)
+            if session is not None:
                 return session
+            creating = self._creating.setdefault(cache_key, threading.Lock())
         
-        # Create new session with the updated parameters
-        new_config = config.model_copy(update={
-            "role": final_role,
-            "warehouse": final_warehouse,
-            "database": final_database,
-            "schema": schema
-        })
+        # Concurrent misses for a key open one session; the cache lock isn't
+        # held while authenticating, so other keys aren't blocked
+        with creating:
+            try:
+                with self._cache_lock:
+                    session = self._get_cached_session(cache_key)
+                if session is None:
+                    session = self._create_session(config, cache_key)
+                    with self._cache_lock:
+                        self._cache_session(cache_key, session)
+                    logger.info(f"Cached new session for {cache_key}")
+            finally:
+                with self._cache_lock:
+                    if self._creating.get(cache_key) is creating:
+                        del self._creating[cache_key]
+            
+        return session
+    
+    @contextmanager
+    def pooled_session(
+        self,
+        role: Optional[str] = None,
+        warehouse: Optional[str] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+        timeout: Optional[float] = 30.0
+    ) -> Iterator[Session]:
+        """Check out a session for exclusive use, returning it to the pool on exit
         
-        # Create a new connection with the desired parameters
-        new_conn = self.from_config(new_config)
+        Unlike `get_session`, which shares one session per context, each caller
+        gets its own session. Up to `max_pool_size` sessions are created lazily
+        per context; further callers wait for one to be checked back in. Idle
+        sessions older than `session_ttl` are closed instead of reused, and a
+        session whose block raised is closed instead of being checked back in.
         
-        # Cache the session if requested
-        if use_cache:
-            cache_key = (final_role, final_warehouse, final_database)
-            self._session_cache[cache_key] = new_conn.session
-            logger.info(f"Cached new session for {cache_key}")
+        Args:
+            role: Override default role
+            warehouse: Override default warehouse
+            database: Override default database
+            schema: Override default schema
+            timeout: Seconds to wait for a free session (None waits forever)
             
-        return new_conn.session
+        Example:
+            >>> with conn.pooled_session(warehouse="LOAD_WH") as session:
+            ...     session.sql("SELECT 1").collect()
+        """
+        config, cache_key = self._resolve_session_key(role, warehouse, database, schema)
+        pool = self._pools.setdefault(cache_key, queue.LifoQueue())
+        slots = self._pool_slots.setdefault(
+            cache_key, threading.BoundedSemaphore(self.max_pool_size)
+        )
+        
+        if not slots.acquire(timeout=timeout):
+            raise ConnectionError(f"No pooled session available for {cache_key} after {timeout}s")
+        try:
+            session = None
+            while session is None:
+                try:
+                    session, created_at = pool.get_nowait()
+                except queue.Empty:
+                    session, created_at = self._create_session(config, cache_key), time.monotonic()
+                    logger.info(f"Opened pooled session for {cache_key}")
+                    break
+                if time.monotonic() - created_at > self.session_ttl:
+                    # Idle and expired, so nobody else holds it
+                    self._close_pooled(session)
+                    logger.info(f"Pooled session for {cache_key} expired")
+                    session = None
+            
+            with self._cache_lock:
+                self._checked_out.add(session)
+            try:
+                yield session
+            except BaseException:
+                # The session may be broken; don't hand it to the next caller
+                with self._cache_lock:
+                    self._checked_out.discard(session)
+                self._close_pooled(session)
+                raise
+            with self._cache_lock:
+                # close(close_all=True) may have closed it while checked out
+                still_open = session in self._checked_out
+                self._checked_out.discard(session)
+            if still_open:
+                pool.put((session, created_at))
+        finally:
+            slots.release()
+    
+    @staticmethod
+    def _close_pooled(session: Session) -> None:
+        """Close a pooled session that won't be reused"""
+        try:
+            session.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled session: {str(e)}")
+    
+    @cached_property
+    def _session_config(self) -> ConnectionConfig:
+        """Minimal config describing the current session, built once
+        
+        The values come straight from Snowflake, so validation is skipped.
+        """
+        return ConnectionConfig.model_construct(
+            user=self.session.get_current_user(),
+            account=self.session.get_current_account(),
+            role=self.role,
+            warehouse=self.warehouse,
+            database=self.database,
+            schema=self.schema
+        )
+    
+    def _resolve_session_key(
+        self,
+        role: Optional[str],
+        warehouse: Optional[str],
+        database: Optional[str],
+        schema: Optional[str]
+    ) -> Tuple[ConnectionConfig, _SessionKey]:
+        """Resolve the base config and session key for the requested context"""
+        # Use existing config or a minimal one based on the current connection
+        config = self._config or self._session_config
+        cache_key = (
+            config.user,
+            role or config.role,
+            warehouse or self.warehouse,
+            database or self.database,
+            schema or self.schema
+        )
+        return config, cache_key
+    
+    def _create_session(self, config: ConnectionConfig, cache_key: _SessionKey) -> Session:
+        """Open a new session for the given session key"""
+        _, role, warehouse, database, schema = cache_key
+        new_config = config.model_copy(update={
+            "role": role,
+            "warehouse": warehouse,
+            "database": database,
+            "schema": schema
+        })
+        return self._build_session(new_config)
     
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
+        # Only transient errors are retried, so this budget applies to them alone
+        retry=retry_if_exception(_is_transient),
+        stop=stop_after_attempt(5),
+        # Jitter keeps concurrent callers from retrying in lockstep
+        wait=wait_exponential_jitter(initial=1, max=30, jitter=0.5),
         retry_error_callback=lambda retry_state: logger.error(
             f"Failed after {retry_state.attempt_number} attempts: {retry_state.outcome.exception()}"
         )
     )
     def execute_query(self, query: str) -> Any:
-        """Execute query with retry logic"""
+        """Execute query, retrying only transient connection errors"""
         try:
             return self.session.sql(query).collect()
         except Exception as e:
-            raise ConnectionError(f"Query execution failed: {str(e)}")
+            raise ConnectionError(f"Query execution failed: {str(e)}") from e
     
     def test_connection(self) -> bool:
-        """Test if connection is working"""
+        """Test if connection is working
+        
+        A successful test is reused for `health_check_ttl` seconds so repeated
+        checks don't each pay a round trip. The ping is a single attempt with
+        a short statement timeout, bypassing `execute_query`'s retries, so an
+        unhealthy connection is reported quickly.
+        """
+        if time.monotonic() - self._last_ok_ts < self.health_check_ttl:
+            return True
         try:
-            self.execute_query('SELECT 1')
+            self.session.sql('SELECT 1').collect(
+                statement_params={"STATEMENT_TIMEOUT_IN_SECONDS": str(self.health_check_timeout)}
+            )
+            self._last_ok_ts = time.monotonic()
             logger.info("Connection test successful")
             return True
         except Exception as e:
+            self._last_ok_ts = 0.0
             logger.error(f"Connection test failed: {str(e)}")
             return False
             
@@ -303,15 +640,33 @@ class SnowflakeConnection:
         Args:
             close_all: Whether to close all cached sessions
         """
+        self._last_ok_ts = 0.0
         try:
             if close_all:
                 # Close all cached sessions
-                for session in self._session_cache.values():
-                    try:
-                        session.close()
-                    except Exception as e:
-                        logger.warning(f"Error closing cached session: {str(e)}")
-                self._session_cache.clear()
+                with self._cache_lock:
+                    sessions = [session for session, _ in self._session_cache.values()]
+                    sessions.extend(self._retired_sessions)
+                    for session in sessions:
+                        try:
+                            session.close()
+                        except Exception as e:
+                            logger.warning(f"Error closing cached session: {str(e)}")
+                    self._session_cache.clear()
+                    self._retired_sessions.clear()
+                
+                # Close idle and checked-out pooled sessions
+                for pool in self._pools.values():
+                    while True:
+                        try:
+                            self._close_pooled(pool.get_nowait()[0])
+                        except queue.Empty:
+                            break
+                with self._cache_lock:
+                    checked_out = list(self._checked_out)
+                    self._checked_out.clear()
+                for session in checked_out:
+                    self._close_pooled(session)
                 logger.info("All sessions closed successfully")
             else:
                 # Close only the main session
@@ -328,7 +683,185 @@ class SnowflakeConnection:
         self.close(close_all=True)
 
 
-# %% ../nbs/05_connection.ipynb 5
+# %% ../nbs/05_connection.ipynb 7
+# Plain identifiers, or double-quoted ones with embedded quotes doubled
+_IDENTIFIER_PATTERN = re.compile(r'^(?:[A-Za-z_][A-Za-z0-9_$]*|"(?:[^"]|"")+")$')
+
+def _identifier(name: str, kind: str) -> str:
+    """Validate a Snowflake identifier before interpolating it into SQL
+    
+    Args:
+        name: Identifier to check
+        kind: What the identifier names, used in the error message
+        
+    Returns:
+        The identifier, unchanged
+        
+    Raises:
+        ConfigurationError: If `name` is not a valid identifier
+    """
+    if not _IDENTIFIER_PATTERN.match(name):
+        raise ConfigurationError(f"Invalid {kind} name: {name!r}")
+    return name
+
+def _normalize_identifier(name: Optional[str]) -> Optional[str]:
+    """Resolve an identifier the way Snowflake does, for comparisons"""
+    if name is None:
+        return None
+    if name.startswith('"'):
+        return name[1:-1].replace('""', '"')
+    return name.upper()
+
+def _same_identifier(a: Optional[str], b: Optional[str]) -> bool:
+    """Whether two identifiers name the same object"""
+    return b is not None and _normalize_identifier(a) == _normalize_identifier(b)
+
+# Databases and schemas each session has created, keyed by the role that
+# created them, so one session's (or role's) objects never skip another's CREATE
+_ENSURED_OBJECTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_ENSURED_LOCK = threading.Lock()
+
+def _ensured_keys(
+    role: Optional[str], database: str, schema: Optional[str] = None
+) -> Tuple[tuple, Optional[tuple]]:
+    """Keys of a database and (optionally) schema in `_ENSURED_OBJECTS`"""
+    db_key = (_normalize_identifier(role), _normalize_identifier(database))
+    return db_key, (db_key + (_normalize_identifier(schema),) if schema else None)
+
+def _ensured_objects(session: Session) -> frozenset:
+    """Snapshot of the objects a session has created"""
+    with _ENSURED_LOCK:
+        return frozenset(_ENSURED_OBJECTS.get(session, ()))
+
+def _context_statements(
+    role: Optional[str] = None,
+    warehouse: Optional[str] = None,
+    database: Optional[str] = None,
+    schema: Optional[str] = None,
+    create_objects: bool = False,
+    current: Optional[SnowflakeConnection] = None,
+    ensured: frozenset = frozenset(),
+    create_database: bool = True
+) -> List[str]:
+    """Build the USE/CREATE statements that switch a session's context
+    
+    Statements are ordered so the role is set before anything is created.
+    `schema` is only applied when a `database` is given. Every name is
+    validated first, so none can smuggle extra SQL into the batch.
+    
+    Args:
+        role: Role to use
+        warehouse: Warehouse to use
+        database: Database to use (and create)
+        schema: Schema to use (and create) within `database`
+        create_objects: Whether to create the database/schema if missing
+        current: Connection whose current context can be skipped
+        ensured: Objects already created by this session (see `_ensured_objects`)
+        create_database: Whether `create_objects` covers the database too,
+            or only the schema
+        
+    Returns:
+        Statements still needed, possibly none
+    """
+    statements = []
+    if role and not (current and _same_identifier(role, current.role)):
+        statements.append(f"USE ROLE {_identifier(role, 'role')}")
+    if warehouse and not (current and _same_identifier(warehouse, current.warehouse)):
+        statements.append(f"USE WAREHOUSE {_identifier(warehouse, 'warehouse')}")
+    if database:
+        database = _identifier(database, 'database')
+        if schema:
+            schema = _identifier(schema, 'schema')
+        db_key, schema_key = _ensured_keys(role, database, schema)
+        same_database = bool(current) and _same_identifier(database, current.database)
+        
+        if create_objects and create_database and db_key not in ensured:
+            statements.append(f"CREATE DATABASE IF NOT EXISTS {database}")
+        if not same_database:
+            statements.append(f"USE DATABASE {database}")
+        if schema:
+            if create_objects and schema_key not in ensured:
+                statements.append(f"CREATE SCHEMA IF NOT EXISTS {database}.{schema}")
+            if not (same_database and _same_identifier(schema, current.schema)):
+                statements.append(f"USE SCHEMA {database}.{schema}")
+    return statements
+
+def _mark_ensured(
+    session: Session,
+    role: Optional[str],
+    database: str,
+    schema: Optional[str] = None,
+    create_database: bool = True
+) -> None:
+    """Remember objects a session created so its later context switches skip them"""
+    db_key, schema_key = _ensured_keys(role, database, schema)
+    with _ENSURED_LOCK:
+        ensured = _ENSURED_OBJECTS.setdefault(session, set())
+        if create_database:
+            ensured.add(db_key)
+        if schema_key:
+            ensured.add(schema_key)
+
+def _forget_ensured(session: Session, database: str, schema: Optional[str] = None) -> None:
+    """Forget that a schema (or a database and all its schemas) exists, e.g. after a drop"""
+    database = _normalize_identifier(database)
+    target = (database, _normalize_identifier(schema)) if schema else (database,)
+    with _ENSURED_LOCK:
+        ensured = _ENSURED_OBJECTS.get(session)
+        if ensured:
+            # Keys are (role, database[, schema]); match whatever role made them
+            ensured.difference_update(
+                [key for key in ensured if key[1:1 + len(target)] == target]
+            )
+
+def _apply_context(
+    session: Session,
+    role: Optional[str] = None,
+    warehouse: Optional[str] = None,
+    database: Optional[str] = None,
+    schema: Optional[str] = None,
+    create_objects: bool = False,
+    current: Optional[SnowflakeConnection] = None,
+    create_database: bool = True
+) -> None:
+    """Switch a session's context in one round trip, see `_context_statements`
+    
+    Objects this session created earlier skip their CREATE. If they have
+    been dropped since, the switch fails; it is then retried once with the
+    CREATE statements included.
+    """
+    def statements() -> List[str]:
+        return _context_statements(
+            role, warehouse, database, schema, create_objects, current,
+            ensured=_ensured_objects(session), create_database=create_database
+        )
+    
+    first = statements()
+    try:
+        _run_statements(session, first)
+    except Exception as e:
+        if not (create_objects and database):
+            raise
+        _forget_ensured(session, database)
+        retry = statements()
+        if retry == first:
+            raise
+        logger.info(f"Context switch failed ({str(e)}), retrying with CREATE statements")
+        _run_statements(session, retry)
+    if create_objects and database:
+        _mark_ensured(session, role, database, schema, create_database)
+
+def _run_statements(session: Session, statements: List[str]) -> None:
+    """Run statements in a single round trip using a multi-statement request"""
+    if not statements:
+        return
+    if len(statements) == 1:
+        session.sql(statements[0]).collect()
+        return
+    session.sql(";\n".join(statements)).collect(
+        statement_params={"MULTI_STATEMENT_COUNT": str(len(statements))}
+    )
+
 def get_connection(
     database: Optional[str] = None,
     schema: Optional[str] = None,
@@ -353,6 +886,7 @@ def get_connection(
     
     Raises:
         ConnectionError: If connection cannot be established
+        ConfigurationError: If a database or schema to create isn't a valid identifier
     """
     try:
         # Try to get active session (e.g., in Snowflake worksheet)
@@ -362,35 +896,28 @@ def get_connection(
         
         # Override with provided parameters if any
         if any([database, schema, warehouse, role]):
-            # Use the existing session but update parameters
+            # Switch the existing session's context in one round trip,
+            # skipping whatever it is already set to
+            # A schema alone is created in the current database, which isn't created
+            create_database = bool(database)
+            if schema and not database:
+                database = conn.database
+            _apply_context(
+                conn.session, role, warehouse, database, schema, create_objects,
+                current=conn, create_database=create_database
+            )
+            
             if role:
-                conn.session.sql(f"USE ROLE {role}").collect()
-                
+                conn.role = role
             if warehouse:
-                conn.session.sql(f"USE WAREHOUSE {warehouse}").collect()
                 conn.warehouse = warehouse
-                
             if database:
-                if create_objects:
-                    # Create database if it doesn't exist
-                    conn.session.sql(f"CREATE DATABASE IF NOT EXISTS {database}").collect()
-                
-                # Now use the database
-                conn.session.sql(f"USE DATABASE {database}").collect()
                 conn.database = database
-                
-            if schema and conn.database:
-                if create_objects:
-                    # Create schema if it doesn't exist
-                    conn.session.sql(f"CREATE SCHEMA IF NOT EXISTS {conn.database}.{schema}").collect()
-                
-                # Now use the schema
-                conn.session.sql(f"USE SCHEMA {conn.database}.{schema}").collect()
-                conn.schema = schema
+                if schema:
+                    conn.schema = schema
             
             # Log updated connection info
-            logger.info(f"Using role: {conn.session.get_current_role()}, "
-                       f"warehouse: {conn.session.get_current_warehouse()}, "
+            logger.info(f"Using role: {conn.role}, warehouse: {conn.warehouse}, "
                        f"database: {conn.database}, schema: {conn.schema}")
             
         return conn
@@ -412,31 +939,30 @@ def get_connection(
         if schema:
             config.schema = schema
             
+        # Bad names are a config error, not a permissions issue to warn about
+        # below, so check them before opening the session
+        if create_objects and database:
+            _identifier(database, 'database')
+            if schema:
+                _identifier(schema, 'schema')
+        
         # Create connection with the config
         conn = SnowflakeConnection.from_config(config)
         
         # Now handle database and schema creation if requested
         if create_objects and database:
             try:
-                # Create database if it doesn't exist
-                conn.session.sql(f"CREATE DATABASE IF NOT EXISTS {database}").collect()
-                
-                # Use the database
-                conn.session.sql(f"USE DATABASE {database}").collect()
+                # Create and switch to the database/schema in one round trip
+                _apply_context(
+                    conn.session, database=database, schema=schema, create_objects=True
+                )
                 conn.database = database
-                
                 if schema:
-                    # Create schema if it doesn't exist
-                    conn.session.sql(f"CREATE SCHEMA IF NOT EXISTS {conn.database}.{schema}").collect()
-                    
-                    # Use the schema
-                    conn.session.sql(f"USE SCHEMA {conn.database}.{schema}").collect()
                     conn.schema = schema
             except Exception as e:
                 logger.warning(f"Error creating database/schema: {str(e)}")
                 # Continue anyway, might be permissions issue but DB/schema might already exist
         
-        logger.info(f"Using role: {conn.session.get_current_role()}, "
-                   f"warehouse: {conn.session.get_current_warehouse()}, "
+        logger.info(f"Using role: {conn.role}, warehouse: {conn.warehouse}, "
                    f"database: {conn.database}, schema: {conn.schema}")
         return conn
@@ -6,8 +6,7 @@
 from __future__ import annotations
 from typing import Union, List, Dict, Optional, Protocol, Callable
 from dataclasses import dataclass
-from fastcore.basics import listify
-import snowflake.snowpark.functions as F
+from functools import lru_cache
 from snowflake.snowpark import DataFrame, Session
 
 
@@ -54,12 +53,33 @@ def create_feature_view_name(
         >>> create_feature_view_name('RETAIL', 'CUSTOMER', 'BEHAVIOR')
         'FV_RETAIL_CUSTOMER_BEHAVIOR'
     """
-    parts = [defaults.feature_view_prefix, entity, feature_type]
-    if domain: parts.insert(1, domain)
-    return "_".join(part.upper() for part in parts)
+    prefix = defaults.feature_view_prefix.upper()
+    if domain: return f"{prefix}_{domain.upper()}_{entity.upper()}_{feature_type.upper()}"
+    return f"{prefix}_{entity.upper()}_{feature_type.upper()}"
 
 
 # %% ../nbs/04_core.ipynb 11
+@lru_cache(maxsize=256)
+def _parse_sql(query:str) -> tuple:
+    "Parse Snowflake SQL into expressions, shared across formatter calls (copy before mutating)"
+    import sqlglot
+    return tuple(e for e in sqlglot.parse(query, read='snowflake') if e is not None)
+
+@lru_cache(maxsize=256)
+def _format_sql(query:str, subq_to_cte:bool) -> str:
+    "Render `query` as pretty Snowflake SQL (cached)"
+    import sqlglot
+    from sqlglot.optimizer.eliminate_subqueries import eliminate_subqueries
+    expressions = _parse_sql(query)
+    if not expressions:
+        # Let sqlglot raise its usual error for empty input
+        sqlglot.parse_one(query, read='snowflake')
+    # Only the first statement of multi-statement input is formatted
+    expression = expressions[0]
+    if subq_to_cte:
+        expression = eliminate_subqueries(expression.copy())
+    return expression.sql(dialect='snowflake', pretty=True)
+
 class SQLFormatter:
     "Utilities for SQL query formatting and analysis"
     
@@ -84,11 +104,7 @@ class SQLFormatter:
             SELECT a, b
             FROM _q1
         """
-        import sqlglot
-        expression = sqlglot.parse_one(query)
-        if subq_to_cte:
-            query = sqlglot.optimizer.optimizer.eliminate_subqueries(expression).sql()
-        return sqlglot.transpile(query, read='snowflake', pretty=True)[0]
+        return _format_sql(query, subq_to_cte)
     
     @staticmethod
     def extract_table_names(query:str) -> List[str]:
@@ -105,11 +121,6 @@ class SQLFormatter:
             >>> SQLFormatter.extract_table_names(sql)
             ['table1', 'table2']
         """
-        import sqlglot
         from sqlglot.expressions import Table
-        tables = set()
-        for expr in sqlglot.parse(query):
-            for table in expr.find_all(Table):
-                tables.add(table.name)
-        return list(tables)
+        return list({table.name for expr in _parse_sql(query) for table in expr.find_all(Table)})
 
@@ -4,12 +4,16 @@
 
 # %% ../nbs/08_example_functions.ipynb 2
 from __future__ import annotations
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 import snowflake.snowpark.functions as F
 from snowflake.snowpark import Session, DataFrame
 from snowflake.snowpark.types import *
 from datetime import datetime, timedelta
-import random
+from functools import lru_cache
+import logging
+from types import MappingProxyType
+import numpy as np
+import pandas as pd
 
 from .connection import get_connection
 from .manager import feature_store_session
@@ -32,6 +36,52 @@ from .logging import logger
 __all__ = ['generate_demo_data', 'get_example_data', 'create_feature_configs', 'run_end_to_end_example']
 
 # %% ../nbs/08_example_functions.ipynb 3
+# Past a few thousand rows, a Parquet stage load beats row-by-row INSERT VALUES
+_BULK_UPLOAD_ROWS = 10_000
+# Bulk loads are generated and staged this many rows at a time
+_UPLOAD_CHUNK_ROWS = 100_000
+
+def _demo_columns(
+    rng: np.random.Generator,
+    start_date: datetime,
+    first_day: int,
+    num_days: int,
+    num_customers: int,
+    per_day: int,
+    ltv_multiplier: float,
+    session_length_multiplier: float
+) -> Dict[str, np.ndarray]:
+    """Generate the demo data columns for `num_days` days starting at `first_day`"""
+    # Shuffle every day's customer list in one call, keep the first per_day
+    cust_ids = rng.permuted(
+        np.tile(np.arange(num_customers, dtype=np.int64), (num_days, 1)), axis=1
+    )[:, :per_day].reshape(-1)
+    dates = np.repeat(np.array([
+        (start_date + timedelta(days=day)).date()
+        for day in range(first_day, first_day + num_days)
+    ], dtype=object), per_day)
+    n_rows = len(cust_ids)
+    
+    # Basic metrics, drawn for all rows at once
+    ltv = rng.uniform(100, 75000, n_rows) / 100 * ltv_multiplier
+    session_length = (ltv / 100 + rng.uniform(0, 5, n_rows)) * session_length_multiplier
+    session_length[rng.random(n_rows) <= 0.2] = np.nan  # 20% null
+    
+    # Derived metrics
+    time_on_app = ltv / 100 + rng.uniform(1, 7, n_rows)
+    time_on_website = ltv / 100 + rng.uniform(3, 7, n_rows)
+    transactions = np.maximum(1, (ltv / 100).astype(np.int64))
+    
+    return {
+        'CUSTOMER_ID': np.char.add('C', cust_ids.astype(str)),
+        'DATE': dates,
+        'LIFE_TIME_VALUE': ltv,
+        'SESSION_LENGTH': session_length,
+        'TIME_ON_APP': time_on_app,
+        'TIME_ON_WEBSITE': time_on_website,
+        'TRANSACTIONS': transactions
+    }
+
 def generate_demo_data(
     session: Session, 
     schema: str,
@@ -56,65 +106,73 @@ def generate_demo_data(
     try:
         start_date = start_date or (datetime.now() - timedelta(days=num_days))
         
-        # Create functions for generating data
-        def generate_customer_row(customer_id: int, date: datetime) -> List:
-            """Generate a single customer data row"""
-            # Basic metrics
-            ltv = random.uniform(100, 75000) / 100 * ltv_multiplier
-            session_length = (ltv / 100 + random.uniform(0, 5)) * session_length_multiplier
-            
-            # Derived metrics
-            time_on_app = ltv / 100 + random.uniform(1, 7)
-            time_on_website = ltv / 100 + random.uniform(3, 7)
-            transactions = max(1, int(ltv / 100))
-            
-            return [
-                f'C{customer_id}',
-                date.strftime('%Y-%m-%d'),
-                ltv,
-                session_length if random.random() > 0.2 else None,  # 20% null
-                time_on_app,
-                time_on_website,
-                transactions
-            ]
+        rng = np.random.default_rng()
         
-        # Generate data for each day
-        data = []
-        for day in range(num_days):
-            date = start_date + timedelta(days=day)
-            # Generate data for active customers (80% active each day)
-            active_customers = random.sample(
-                range(num_customers), 
-                k=int(num_customers * 0.8)
-            )
-            for cust_id in active_customers:
-                data.append(generate_customer_row(cust_id, date))
+        # Pick active customers for each day (80% active each day)
+        per_day = int(num_customers * 0.8)
+        n_rows = per_day * num_days
         
-       # Define schema
-        schema_struct = StructType([
-            StructField('CUSTOMER_ID', StringType()),
-            StructField('DATE', DateType()),
-            StructField('LIFE_TIME_VALUE', DoubleType()),
-            StructField('SESSION_LENGTH', DoubleType()),
-            StructField('TIME_ON_APP', DoubleType()),
-            StructField('TIME_ON_WEBSITE', DoubleType()),
-            StructField('TRANSACTIONS', LongType())
-        ])
-        
-        # Create DataFrame
-        df = session.create_dataframe(
-            data,
-            schema=schema_struct  # Pass the StructType directly
-        )
+        table = f"CUSTOMER_ACTIVITY{'' if table_type == '' else '_' + table_type.upper()}"
+        table_name = f"{session.get_current_database()}.{schema}.{table}"
         
-        # Save to table
-        table_name = f"{session.get_current_database()}.{schema}.CUSTOMER_ACTIVITY{'' if table_type == '' else '_' + table_type.upper()}"
-        df.write.mode('overwrite').save_as_table(table_name)
+        if n_rows >= _BULK_UPLOAD_ROWS:
+            # Generate and load whole days at a time, so memory stays bounded by the chunk
+            days_per_chunk = max(1, _UPLOAD_CHUNK_ROWS // per_day)
+            for first_day in range(0, num_days, days_per_chunk):
+                columns = _demo_columns(
+                    rng, start_date, first_day, min(days_per_chunk, num_days - first_day),
+                    num_customers, per_day, ltv_multiplier, session_length_multiplier
+                )
+                # Stage the typed columns as compressed Parquet and COPY INTO the table;
+                # DATE holds datetime.date objects, which Parquet stores as a date.
+                # The first chunk replaces the table, the rest append to it
+                df = session.write_pandas(
+                    pd.DataFrame(columns, copy=False),
+                    table,
+                    database=session.get_current_database(),
+                    schema=schema,
+                    compression='snappy',
+                    quote_identifiers=False,
+                    auto_create_table=first_day == 0,
+                    overwrite=first_day == 0,
+                    use_logical_type=True
+                )
+        else:
+            columns = _demo_columns(
+                rng, start_date, 0, num_days,
+                num_customers, per_day, ltv_multiplier, session_length_multiplier
+            )
+            
+            # Define schema
+            schema_struct = StructType([
+                StructField('CUSTOMER_ID', StringType()),
+                StructField('DATE', DateType()),
+                StructField('LIFE_TIME_VALUE', DoubleType()),
+                StructField('SESSION_LENGTH', DoubleType()),
+                StructField('TIME_ON_APP', DoubleType()),
+                StructField('TIME_ON_WEBSITE', DoubleType()),
+                StructField('TRANSACTIONS', LongType())
+            ])
+            
+            session_length = columns['SESSION_LENGTH']
+            columns['SESSION_LENGTH'] = np.where(np.isnan(session_length), None, session_length)
+            data = list(zip(*(col.tolist() for col in columns.values())))
+            
+            # Create DataFrame
+            df = session.create_dataframe(
+                data,
+                schema=schema_struct  # Pass the StructType directly
+            )
+            
+            # Save to table
+            df.write.mode('overwrite').save_as_table(table_name)
         
-        logger.info(f"Generated {len(data)} rows of demo data in {table_name}")
-        logger.debug("Schema:")
-        for field in df.schema.fields:
-            logger.debug(f"{field.name}: {field.datatype}")
+        logger.info(f"Generated {n_rows} rows of demo data in {table_name}")
+        # Fetching the schema is a metadata call, so only do it when it gets logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Schema:")
+            for field in df.schema.fields:
+                logger.debug("%s: %s", field.name, field.datatype)
         
     except Exception as e:
         logger.error(f"Error generating demo data: {str(e)}")
@@ -176,8 +234,13 @@ def get_example_data(
 
 
 # %% ../nbs/08_example_functions.ipynb 5
-def create_feature_configs() -> Dict[str, FeatureConfig]:
-    """Create example feature configurations"""
+@lru_cache(maxsize=1)
+def create_feature_configs() -> Mapping[str, FeatureConfig]:
+    """Create example feature configurations
+    
+    Built once and shared between calls, so the mapping is read-only; copy
+    it with `dict(...)` to modify.
+    """
     try:
         # Basic features
         configs = {
@@ -234,7 +297,7 @@ def create_feature_configs() -> Dict[str, FeatureConfig]:
             )
         })
         
-        return configs
+        return MappingProxyType(configs)
         
     except Exception as e:
         logger.error(f"Error creating feature configs: {str(e)}")
@@ -328,7 +391,7 @@ def run_end_to_end_example(
             logger.info("\nFeature Statistics:")
             for feature_name, stats in manager.feature_stats[config.name].items():
                 logger.info(f"\n{feature_name}:")
-                logger.info(str(stats))
+                logger.info("%s", stats)
             
         
             # 6. Generate Training Dataset
@@ -4,12 +4,16 @@
 
 # %% ../nbs/03_feature_view.ipynb 2
 from __future__ import annotations
-from typing import Dict, List, Optional, Union, Set
-from datetime import datetime
-from snowflake.snowpark import DataFrame
+from typing import Dict, List, Optional, Tuple, Union, Set
+from dataclasses import dataclass, asdict
+from functools import cached_property
+from datetime import datetime, timezone
+from snowflake.snowpark import Column, DataFrame
 from snowflake.ml.feature_store import FeatureView, Entity
 import snowflake.snowpark.functions as F
 import json
+import logging
+import numpy as np
 
 # Import our modules
 from .exceptions import FeatureViewError, ValidationError
@@ -20,17 +24,24 @@ from snowflake_feature_store.config import (FeatureViewConfig,
 )
 from snowflake.snowpark.types import (
     StructType, StructField, StringType, DateType,
-    DoubleType, LongType, TimestampType
+    DoubleType, LongType, TimestampType,
+    ByteType, DecimalType, FloatType, IntegerType, ShortType
 )
 from .transforms import Transform, TransformConfig
 
 
 # %% auto 0
-__all__ = ['FeatureStats', 'FeatureMonitor', 'FeatureViewBuilder', 'create_feature_view']
+__all__ = ['FeatureStats', 'FeatureMonitor', 'compute_stats_batch', 'detect_drift_batch', 'FeatureViewBuilder',
+           'create_feature_view']
 
 # %% ../nbs/03_feature_view.ipynb 3
-class FeatureStats(BaseModel):
-    """Statistics for feature monitoring"""
+@dataclass(frozen=True)
+class FeatureStats:
+    """Statistics for feature monitoring
+    
+    Built from typed aggregate results, so it's a plain dataclass rather
+    than a validated model.
+    """
     timestamp: datetime
     row_count: int
     null_count: int
@@ -43,6 +54,11 @@ class FeatureStats(BaseModel):
     
     def __str__(self) -> str:
         """Pretty print statistics"""
+        return self._formatted
+    
+    @cached_property
+    def _formatted(self) -> str:
+        """Formatted statistics, built on first use; the stats never change"""
         stats = [
             f"Timestamp: {self.timestamp.isoformat()}",
             f"Row count: {self.row_count}",
@@ -60,14 +76,21 @@ class FeatureStats(BaseModel):
             
         return "\n".join(stats)
     
-    def model_dump(self, **kwargs) -> Dict:
+    def model_dump(self) -> Dict:
         """Convert stats to dictionary for storage/display"""
-        data = super().model_dump(**kwargs)
+        data = asdict(self)
         data['timestamp'] = self.timestamp.isoformat()
         return data
 
 
 # %% ../nbs/03_feature_view.ipynb 4
+# Snowpark types that get min/max/mean/std statistics
+_NUMERIC_TYPES = (ByteType, ShortType, IntegerType, LongType, FloatType, DoubleType, DecimalType)
+
+def _optional_float(value) -> Optional[float]:
+    """Convert an aggregate result to float, keeping NULL as None"""
+    return float(value) if value is not None else None
+
 class FeatureMonitor:
     """Monitor feature statistics and detect drift"""
     
@@ -80,11 +103,11 @@ class FeatureMonitor:
 
     def _verify_column_names(self, df: DataFrame, column: str) -> None:
         """Verify column names in DataFrame"""
-        logger.debug(f"All columns: {df.columns}")
-        logger.debug(f"Schema: {df.schema}")
-        logger.debug(f"Looking for column: {column}")
-        if column not in df.columns:
-            matches = [c for c in df.columns if c.upper() == column.upper()]
+        columns = df.columns
+        logger.debug("All columns: %s", columns)
+        logger.debug("Looking for column: %s", column)
+        if column not in columns:
+            matches = [c for c in columns if c.upper() == column.upper()]
             if matches:
                 logger.warning(f"Column case mismatch. Found {matches[0]} instead of {column}")
     
@@ -124,89 +147,173 @@ class FeatureMonitor:
         
         return drift_metrics
         
-    def compute_stats(self, df: DataFrame, column: str) -> FeatureStats:
-        """Compute statistics for a feature column"""
-        try:
+    def agg_exprs(
+        self,
+        df: DataFrame,
+        column: str,
+        prefix: str = "",
+        schema_field: Optional[StructField] = None,
+        detailed: Optional[bool] = None
+    ) -> List[Column]:
+        """Build the aggregate expressions for a feature column's statistics
+        
+        Args:
+            df: DataFrame containing the feature
+            column: Feature column name
+            prefix: Prefix for result aliases, so several features can share one query
+            schema_field: The column's schema field, if the caller already has it;
+                skips the column check and schema lookup
+            detailed: Override `collect_detailed_stats` for this query
+            
+        Returns:
+            Expressions to pass to `DataFrame.agg`; read back with `stats_from_row`
+        """
+        if schema_field is None:
             # Verify column names first
             self._verify_column_names(df, column)
-            total_count = df.count()
-            null_count = df.filter(F.col(column).is_null()).count()
+        col = F.col(column)
+        agg_exprs = [
+            F.count(F.lit(1)).alias(f"{prefix}ROW_COUNT"),
+            F.count(col).alias(f"{prefix}NON_NULL_COUNT")
+        ]
+        
+        if self.collect_detailed_stats if detailed is None else detailed:
+            # Get column type and schema field
+            if schema_field is None:
+                schema_field = next(field for field in df.schema.fields if field.name.upper() == column.upper())
+            col_type = schema_field.datatype
+            logger.debug("Computing stats for %s (type: %s)", column, col_type)
             
-            # Initialize stats
-            stats = {
-                'timestamp': datetime.utcnow(),
-                'row_count': total_count,
-                'null_count': null_count,
-                'null_ratio': null_count / total_count if total_count > 0 else 1.0
-            }
+            # Always compute unique count
+            agg_exprs.append(F.count_distinct(col).alias(f"{prefix}UNIQUE_COUNT"))
             
-            if self.collect_detailed_stats:
-                # Get column type and schema field
-                schema_field = next(field for field in df.schema.fields if field.name.upper() == column.upper())
-                col_type = str(schema_field.datatype)
-                logger.debug(f"Computing stats for {column} (type: {col_type})")
-                
-                # Always compute unique count
-                unique_count = df.select(column).distinct().count()
-                stats['unique_count'] = unique_count
-                
-                # Check if column is numeric - improved type checking
-                is_numeric = any(
-                    col_type.upper().startswith(t) 
-                    for t in ['DOUBLE', 'FLOAT', 'INT', 'LONG', 'DECIMAL', 'NUMBER']
-                ) or hasattr(schema_field.datatype, 'scale')
-                
-                logger.debug(f"Column {column} is_numeric: {is_numeric} (type: {col_type})")
-                
-                if is_numeric:
-                    # Compute numeric stats on non-null values
-                    numeric_df = df.filter(F.col(column).is_not_null())
-                    if numeric_df.count() > 0:
-                        # Use agg with explicit column names
-                        agg_df = numeric_df.agg([
-                            F.min(column).alias("MIN_VAL"),
-                            F.max(column).alias("MAX_VAL"),
-                            F.avg(column).alias("AVG_VAL"),
-                            F.stddev(column).alias("STD_VAL")
-                        ])
-                        
-                        # Debug logging
-                        logger.debug(f"Aggregation columns: {agg_df.schema.names}")
-                        
-                        # Get result row as dictionary
-                        result_dict = agg_df.collect()[0].asDict()
-                        
-                        # Debug logging
-                        logger.debug(f"Result dict: {result_dict}")
-                        
-                        # Update stats using the correct column names
-                        stats.update({
-                            'min_value': float(result_dict["MIN_VAL"]) if result_dict["MIN_VAL"] is not None else None,
-                            'max_value': float(result_dict["MAX_VAL"]) if result_dict["MAX_VAL"] is not None else None,
-                            'mean_value': float(result_dict["AVG_VAL"]) if result_dict["AVG_VAL"] is not None else None,
-                            'std_value': float(result_dict["STD_VAL"]) if result_dict["STD_VAL"] is not None else None
-                        })
-                        
-                        logger.debug(f"Numeric stats computed for {column}: {stats}")
-                    else:
-                        # No non-null numeric values
-                        stats.update({
-                            'min_value': None,
-                            'max_value': None,
-                            'mean_value': None,
-                            'std_value': None
-                        })
-                else:
-                    # For non-numeric columns, set numeric stats to None
-                    stats.update({
-                        'min_value': None,
-                        'max_value': None,
-                        'mean_value': None,
-                        'std_value': None
-                    })
+            # Check if column is numeric
+            is_numeric = isinstance(col_type, _NUMERIC_TYPES)
+            
+            logger.debug("Column %s is_numeric: %s (type: %s)", column, is_numeric, col_type)
+            
+            if is_numeric:
+                # Aggregates skip nulls, so these cover non-null values only
+                agg_exprs.extend([
+                    F.min(col).alias(f"{prefix}MIN_VAL"),
+                    F.max(col).alias(f"{prefix}MAX_VAL"),
+                    F.avg(col).alias(f"{prefix}AVG_VAL"),
+                    F.stddev(col).alias(f"{prefix}STD_VAL")
+                ])
+        return agg_exprs
+    
+    def violation_exprs(
+        self,
+        column: str,
+        schema_field: Optional[StructField] = None,
+        check_ranges: bool = False
+    ) -> List[Column]:
+        """Build aggregate expressions that evaluate this feature's validation rules
+        
+        Each expression yields `"<column>:<rule>"` when the rule is violated and
+        NULL otherwise, so the checks run in the same query as the statistics.
+        
+        Args:
+            column: Feature column name
+            schema_field: The column's schema field; range checks only apply
+                to numeric columns
+            check_ranges: Also enforce `range_check`/`min_value`/`max_value`;
+                off by default, so only the null threshold fails a build
+            
+        Returns:
+            Expressions for `F.array_construct_compact`, one per rule checked
+        """
+        rules = self.config.validation
+        if rules is None:
+            return []
+        col = F.col(column)
+        row_count = F.count(F.lit(1))
+        
+        # Same rule as `null_ratio > null_threshold`, without dividing;
+        # an empty DataFrame counts as all null
+        too_many_nulls = (row_count - F.count(col)) > row_count * F.lit(rules.null_threshold)
+        if rules.null_threshold < 1:
+            too_many_nulls = too_many_nulls | (row_count == 0)
+        exprs = [F.iff(too_many_nulls, F.lit(f"{column}:null"), F.lit(None))]
+        
+        is_numeric = schema_field is None or isinstance(schema_field.datatype, _NUMERIC_TYPES)
+        if check_ranges and rules.range_check and is_numeric:
+            out_of_range = []
+            if rules.min_value is not None:
+                out_of_range.append(F.min(col) < F.lit(rules.min_value))
+            if rules.max_value is not None:
+                out_of_range.append(F.max(col) > F.lit(rules.max_value))
+            if out_of_range:
+                condition = out_of_range[0] if len(out_of_range) == 1 else out_of_range[0] | out_of_range[1]
+                exprs.append(F.iff(condition, F.lit(f"{column}:range"), F.lit(None)))
+        return exprs
+    
+    def violation_message(self, column: str, rule: str, stats: FeatureStats) -> str:
+        """Describe a rule violation reported by `violation_exprs`"""
+        rules = self.config.validation
+        if rule == "null":
+            return (
+                f"Feature {column} has {stats.null_ratio:.1%} null values, "
+                f"exceeding threshold of {rules.null_threshold:.1%}"
+            )
+        return f"Feature {column} has values outside [{rules.min_value}, {rules.max_value}]"
+    
+    def stats_from_row(
+        self,
+        result_dict: Dict,
+        prefix: str = "",
+        detailed: Optional[bool] = None,
+        timestamp: Optional[datetime] = None
+    ) -> FeatureStats:
+        """Build statistics from an aggregate row produced by `agg_exprs`
+        
+        Args:
+            result_dict: Aggregate result row as a dictionary
+            prefix: Alias prefix passed to `agg_exprs`
+            detailed: The `detailed` value passed to `agg_exprs`
+            timestamp: When the stats were taken (default: now, in UTC)
+        """
+        total_count = int(result_dict[f"{prefix}ROW_COUNT"])
+        null_count = total_count - int(result_dict[f"{prefix}NON_NULL_COUNT"])
+        
+        # Initialize stats
+        stats = {
+            'timestamp': timestamp or datetime.now(timezone.utc),
+            'row_count': total_count,
+            'null_count': null_count,
+            'null_ratio': null_count / total_count if total_count > 0 else 1.0
+        }
+        
+        if self.collect_detailed_stats if detailed is None else detailed:
+            # COUNT(DISTINCT) ignores NULL, which counts as a value here
+            stats['unique_count'] = int(result_dict[f"{prefix}UNIQUE_COUNT"]) + (1 if null_count else 0)
             
-            logger.debug(f"Final stats for {column}: {stats}")
-            return FeatureStats(**stats)
+            # Numeric stats stay None for non-numeric or all-null columns
+            stats.update({
+                'min_value': _optional_float(result_dict.get(f"{prefix}MIN_VAL")),
+                'max_value': _optional_float(result_dict.get(f"{prefix}MAX_VAL")),
+                'mean_value': _optional_float(result_dict.get(f"{prefix}AVG_VAL")),
+                'std_value': _optional_float(result_dict.get(f"{prefix}STD_VAL"))
+            })
+        
+        return FeatureStats(**stats)
+        
+    def compute_stats(
+        self, df: DataFrame, column: str, timestamp: Optional[datetime] = None
+    ) -> FeatureStats:
+        """Compute statistics for a feature column
+        
+        All statistics are gathered by a single aggregate query over `df`.
+        Pass `timestamp` to stamp stats from one run with the same time.
+        """
+        try:
+            # One scan for every statistic
+            result_dict = df.agg(self.agg_exprs(df, column)).collect()[0].asDict()
+            logger.debug("Result dict: %s", result_dict)
+            
+            stats = self.stats_from_row(result_dict, timestamp=timestamp)
+            logger.debug("Final stats for %s: %s", column, stats)
+            return stats
             
         except Exception as e:
             logger.error(f"Error computing stats for {column}: {str(e)}")
@@ -215,7 +322,139 @@ class FeatureMonitor:
             raise FeatureViewError(f"Stats computation failed: {str(e)}")
 
 
-# %% ../nbs/03_feature_view.ipynb 5
+def _batch_agg_exprs(
+    df: DataFrame,
+    monitors: Dict[str, FeatureMonitor],
+    schema_by_name: Dict[str, StructField],
+    detailed: Optional[bool] = None
+) -> Tuple[Dict[str, str], List[Column]]:
+    """Aggregate expressions for several features' stats, to run as one query
+    
+    Returns:
+        Alias prefix by feature name, and the expressions for `DataFrame.agg`
+    """
+    # Prefix each feature's aliases by position so names can't collide
+    prefixes = {name: f"F{i}_" for i, name in enumerate(monitors)}
+    agg_exprs = [
+        expr
+        for name, monitor in monitors.items()
+        for expr in monitor.agg_exprs(
+            df, name, prefixes[name],
+            schema_field=schema_by_name.get(name.upper()),
+            detailed=detailed
+        )
+    ]
+    return prefixes, agg_exprs
+
+def compute_stats_batch(
+    df: DataFrame,
+    monitors: Dict[str, FeatureMonitor],
+    timestamp: Optional[datetime] = None
+) -> Dict[str, FeatureStats]:
+    """Compute statistics for several feature columns in one aggregate query
+    
+    Args:
+        df: DataFrame containing the features
+        monitors: Monitor for each feature column, by column name
+        timestamp: When the stats were taken (default: now, in UTC)
+        
+    Returns:
+        Statistics by feature name
+    """
+    if not monitors:
+        return {}
+    schema_by_name = {field.name.upper(): field for field in df.schema.fields}
+    prefixes, agg_exprs = _batch_agg_exprs(df, monitors, schema_by_name)
+    result_dict = df.agg(agg_exprs).collect()[0].asDict()
+    timestamp = timestamp or datetime.now(timezone.utc)
+    return {
+        name: monitor.stats_from_row(result_dict, prefixes[name], timestamp=timestamp)
+        for name, monitor in monitors.items()
+    }
+
+
+def _stat_array(stats: List[FeatureStats], attr: str) -> np.ndarray:
+    """Gather one statistic across features, with NaN standing in for None"""
+    return np.array(
+        [np.nan if getattr(s, attr) is None else getattr(s, attr) for s in stats],
+        dtype=np.float64
+    )
+
+def detect_drift_batch(
+    baselines: Dict[str, FeatureStats],
+    current: Dict[str, FeatureStats],
+    threshold: Optional[float] = None
+) -> Dict[str, Dict[str, float]]:
+    """Detect drift for many features at once
+    
+    Computes the same metrics as `FeatureMonitor.detect_drift`, as array
+    operations over every feature present in both mappings.
+    
+    Args:
+        baselines: Baseline statistics by feature name
+        current: Current statistics by feature name
+        threshold: Only return features with some metric whose absolute
+            value exceeds this
+        
+    Returns:
+        Dictionary of drift metrics by feature name
+    """
+    names = [name for name in current if name in baselines]
+    if not names:
+        return {}
+    base = [baselines[name] for name in names]
+    curr = [current[name] for name in names]
+    
+    null_change = _stat_array(curr, 'null_ratio') - _stat_array(base, 'null_ratio')
+    curr_mean, base_mean = _stat_array(curr, 'mean_value'), _stat_array(base, 'mean_value')
+    curr_std, base_std = _stat_array(curr, 'std_value'), _stat_array(base, 'std_value')
+    
+    # Numeric drift only where both sides have a mean; std ratio needs non-zero stds
+    has_mean = ~np.isnan(curr_mean) & ~np.isnan(base_mean)
+    has_std = has_mean & (np.nan_to_num(curr_std) != 0) & (np.nan_to_num(base_std) != 0)
+    mean_shift = curr_mean - base_mean
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std_ratio = curr_std / base_std
+    
+    selected = range(len(names))
+    if threshold is not None:
+        # NaN compares False, so missing metrics never count as drift
+        with np.errstate(invalid='ignore'):
+            significant = (
+                (np.abs(null_change) > threshold)
+                | (has_mean & (np.abs(mean_shift) > threshold))
+                | (has_std & (np.abs(std_ratio) > threshold))
+            )
+        selected = np.flatnonzero(significant)
+    
+    drift = {}
+    for i in selected:
+        name = names[i]
+        metrics = {'null_ratio_change': float(null_change[i])}
+        if has_mean[i]:
+            metrics['mean_shift'] = float(mean_shift[i])
+            if has_std[i]:
+                metrics['std_ratio'] = float(std_ratio[i])
+        drift[name] = metrics
+    return drift
+
+
+# %% ../nbs/03_feature_view.ipynb 7
+# Row layout of the stats history table: one row per feature per build
+_STATS_SCHEMA = StructType([
+    StructField('FEATURE_VIEW', StringType()),
+    StructField('FEATURE_NAME', StringType()),
+    StructField('TIMESTAMP', TimestampType()),
+    StructField('ROW_COUNT', LongType()),
+    StructField('NULL_COUNT', LongType()),
+    StructField('NULL_RATIO', DoubleType()),
+    StructField('UNIQUE_COUNT', LongType()),
+    StructField('MIN_VALUE', DoubleType()),
+    StructField('MAX_VALUE', DoubleType()),
+    StructField('MEAN_VALUE', DoubleType()),
+    StructField('STD_VALUE', DoubleType())
+])
+
 class FeatureViewBuilder:
     """Builder for creating feature views with monitoring"""
     
@@ -224,16 +463,38 @@ class FeatureViewBuilder:
         config: FeatureViewConfig,
         feature_df: DataFrame,
         entities: Union[Entity, List[Entity]],
-        collect_stats: bool = True
+        collect_stats: bool = True,
+        stats_table: Optional[str] = None,
+        check_ranges: bool = False
     ):
+        """Initialize the builder
+        
+        Args:
+            config: Feature view configuration
+            feature_df: DataFrame containing feature transformations
+            entities: Entity or list of entities
+            collect_stats: Whether to collect detailed statistics
+            stats_table: Optional table that each build appends its feature
+                stats to, so drift can be queried server-side
+            check_ranges: Fail the build when a feature with `range_check` has
+                values outside `[min_value, max_value]`
+        """
         self.config = config
         self.feature_df = feature_df
         self.entities = [entities] if isinstance(entities, Entity) else entities
         self.monitors: Dict[str, FeatureMonitor] = {}
         self.collect_stats = collect_stats
+        self.stats_table = stats_table
+        self.check_ranges = check_ranges
+        self._feature_stats: Optional[Dict[str, FeatureStats]] = None
+        self._stats_df: Optional[DataFrame] = None
+        
+        # Look the schema up once; monitors reuse these fields for every stats pass
+        fields = feature_df.schema.fields
+        self._schema_by_name = {field.name.upper(): field for field in fields}
         
         # Initialize monitors only for features that exist in the DataFrame
-        available_columns = set(feature_df.columns)
+        available_columns = {field.name for field in fields}
         for name, feature_config in config.features.items():
             if name in available_columns:  # Only monitor existing columns
                 self.monitors[name] = FeatureMonitor(
@@ -241,32 +502,127 @@ class FeatureViewBuilder:
                     collect_detailed_stats=collect_stats
                 )
     
+    def _aggregate_stats(
+        self, detailed: bool, timestamp: datetime, validate: bool = False
+    ) -> Tuple[Dict[str, FeatureStats], List[str]]:
+        """Compute stats for every monitored feature in one aggregate query
+        
+        Args:
+            detailed: Whether to compute detailed statistics
+            timestamp: When the query runs, stamped on every feature's stats
+            validate: Also evaluate every feature's validation rules in the query
+            
+        Returns:
+            Stats by feature, and the `"<feature>:<rule>"` violations found
+        """
+        prefixes, agg_exprs = _batch_agg_exprs(
+            self._stats_df, self.monitors, self._schema_by_name, detailed=detailed
+        )
+        violation_exprs = [
+            expr
+            for name, monitor in self.monitors.items()
+            for expr in monitor.violation_exprs(
+                name, self._schema_by_name.get(name.upper()), check_ranges=self.check_ranges
+            )
+        ] if validate else []
+        if violation_exprs:
+            agg_exprs.append(F.array_construct_compact(*violation_exprs).alias("VIOLATIONS"))
+        
+        result_dict = self._stats_df.agg(agg_exprs).collect()[0].asDict() if agg_exprs else {}
+        stats = {
+            name: monitor.stats_from_row(
+                result_dict, prefixes[name], detailed=detailed, timestamp=timestamp
+            )
+            for name, monitor in self.monitors.items()
+        }
+        # Snowflake returns ARRAY values as JSON text
+        violations = result_dict.get("VIOLATIONS") or []
+        if isinstance(violations, str):
+            violations = json.loads(violations)
+        return stats, violations
+    
+    @property
+    def feature_stats(self) -> Dict[str, FeatureStats]:
+        """Stats for every monitored feature
+        
+        Validation itself only needs null counts, so unless the detailed stats
+        are known to be needed they are computed here, on first access, from
+        the validated DataFrame as it is at that time. They are stamped with
+        the time of that access, and the monitors' baselines are set then.
+        """
+        if self._feature_stats is None:
+            if self._stats_df is None:
+                raise FeatureViewError("Features have not been validated yet")
+            self._feature_stats, _ = self._aggregate_stats(
+                detailed=self.collect_stats, timestamp=datetime.now(timezone.utc)
+            )
+            for name, stats in self._feature_stats.items():
+                # Set as baseline for future monitoring
+                self.monitors[name].set_baseline(stats)
+        return self._feature_stats
+    
     def _validate_features(self) -> None:
-        """Validate features against their configurations"""
-        for name, monitor in self.monitors.items():
-            try:
-                # Compute current stats
-                stats = monitor.compute_stats(self.feature_df, name)
-                
-                # Validate against config
-                if stats.null_ratio > monitor.config.validation.null_threshold:
-                    raise ValidationError(
-                        f"Feature {name} has {stats.null_ratio:.1%} null values, "
-                        f"exceeding threshold of {monitor.config.validation.null_threshold:.1%}"
-                    )
-                
+        """Validate features against their configurations
+        
+        Statistics and rule checks for every monitored feature come from one
+        aggregate query. Detailed statistics are deferred to `feature_stats`
+        unless they will be saved anyway.
+        """
+        self._stats_df = self.feature_df
+        self._feature_stats = None
+        eager = not self.collect_stats or bool(self.stats_table)
+        try:
+            validation_stats, violations = self._aggregate_stats(
+                detailed=self.collect_stats and eager,
+                timestamp=datetime.now(timezone.utc),
+                validate=True
+            )
+        except Exception as e:
+            raise FeatureViewError(f"Validation failed computing feature stats: {str(e)}")
+        
+        if violations:
+            messages = []
+            for violation in violations:
+                name, rule = violation.rsplit(":", 1)
+                messages.append(self.monitors[name].violation_message(name, rule, validation_stats[name]))
+            raise ValidationError(f"Validation failed: {'; '.join(messages)}")
+        
+        for name, stats in validation_stats.items():
+            if eager:
                 # Set as baseline for future monitoring
-                monitor.set_baseline(stats)
-                
-                logger.info(f"Validated feature {name} (stats: {stats.model_dump()})")
-                
-            except Exception as e:
-                raise FeatureViewError(f"Validation failed for {name}: {str(e)}")
+                self.monitors[name].set_baseline(stats)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Validated feature %s (stats: %s)", name, stats.model_dump())
+        
+        if eager:
+            self._feature_stats = validation_stats
+        logger.info(f"Validated {len(validation_stats)} features for {self.config.name}")
+    
+    def _save_stats(self) -> None:
+        """Append this build's feature stats to `stats_table` in a single write"""
+        if not self.feature_stats:
+            return
+        rows = [
+            [
+                self.config.name, name, stats.timestamp,
+                stats.row_count, stats.null_count, stats.null_ratio, stats.unique_count,
+                stats.min_value, stats.max_value, stats.mean_value, stats.std_value
+            ]
+            for name, stats in self.feature_stats.items()
+        ]
+        stats_df = self.feature_df.session.create_dataframe(rows, schema=_STATS_SCHEMA)
+        stats_df.write.mode("append").save_as_table(self.stats_table)
+        logger.info(f"Saved stats for {len(rows)} features to {self.stats_table}")
 
     def _validate_timestamp_col(self, df: DataFrame) -> None:
-        """Validate timestamp column type"""
+        """Validate timestamp column type
+        
+        Runs before validation so the stats query and the feature view share
+        the cast plan. Date and timestamp columns are left untouched.
+        """
         if self.config.timestamp_col:
-            col_type = df.schema[self.config.timestamp_col].datatype
+            field = self._schema_by_name.get(self.config.timestamp_col.upper())
+            col_type = (field or df.schema[self.config.timestamp_col]).datatype
             if not isinstance(col_type, (DateType, TimestampType)):
                 # Try to cast the column
                 logger.warning(
@@ -278,16 +634,19 @@ class FeatureViewBuilder:
                     F.to_date(F.col(self.config.timestamp_col))
                 )
                 self.feature_df = df
+                self._schema_by_name[self.config.timestamp_col.upper()] = StructField(
+                    self.config.timestamp_col, DateType()
+                )
     
     def build(self) -> FeatureView:
         """Build the feature view with validation and monitoring"""
         try:
-            # Validate features first
-            self._validate_features()
-            
-            # Validate timestamp column
+            # Cast the timestamp column first so everything below uses one plan
             self._validate_timestamp_col(self.feature_df)
             
+            # Validate features
+            self._validate_features()
+            
             # Create feature view
             feature_view = FeatureView(
                 name=self.config.name,
@@ -305,6 +664,9 @@ class FeatureViewBuilder:
             }
             feature_view = feature_view.attach_feature_desc(feature_descriptions)
             
+            if self.stats_table:
+                self._save_stats()
+            
             return feature_view
             
         except Exception as e:
@@ -312,12 +674,14 @@ class FeatureViewBuilder:
             raise FeatureViewError(f"Feature view creation failed: {str(e)}")
 
 
-# %% ../nbs/03_feature_view.ipynb 6
+# %% ../nbs/03_feature_view.ipynb 9
 def create_feature_view(
     config: FeatureViewConfig,
     feature_df: DataFrame,
     entities: Union[Entity, List[Entity]],
-    collect_stats: bool = True
+    collect_stats: bool = True,
+    stats_table: Optional[str] = None,
+    check_ranges: bool = False
 ) -> FeatureView:
     """Create a feature view with validation and monitoring
     
@@ -326,6 +690,9 @@ def create_feature_view(
         feature_df: DataFrame containing feature transformations
         entities: Entity or list of entities
         collect_stats: Whether to collect detailed statistics
+        stats_table: Optional table to append feature stats history to
+        check_ranges: Fail when a feature with `range_check` has values
+            outside `[min_value, max_value]`
         
     Returns:
         Configured FeatureView object
@@ -347,7 +714,9 @@ def create_feature_view(
         ...     }
         ... )
         >>> entity = Entity("CUSTOMER", ["customer_id"])
-        >>> feature_view = create_feature_view(config, df, entity)
+        >>> feature_view = create_feature_view(config, df, entity, check_ranges=True)
     """
-    return FeatureViewBuilder(config, feature_df, entities, collect_stats).build()
+    return FeatureViewBuilder(
+        config, feature_df, entities, collect_stats, stats_table, check_ranges
+    ).build()
 
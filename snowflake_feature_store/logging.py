@@ -5,13 +5,19 @@
 # %% ../nbs/03_logging.ipynb 2
 from __future__ import annotations
 import logging
-from typing import Optional
+import logging.handlers
+from typing import Dict, Optional
+import atexit
+import queue
 import sys
 
 # %% auto 0
 __all__ = ['logger', 'setup_logger']
 
 # %% ../nbs/03_logging.ipynb 3
+# Background listeners by logger name, so reconfiguring a logger stops its old one
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
 def setup_logger(
     name: str = "snowflake_feature_store",
     level: int = logging.INFO,
@@ -19,6 +25,9 @@ def setup_logger(
 ) -> logging.Logger:
     """Set up logger with consistent formatting
     
+    Records are queued and written by a background listener thread, so
+    logging calls don't block on console or file I/O.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -30,8 +39,11 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # Remove existing handlers
+    # Remove existing handlers, flushing anything the old listener still holds
     logger.handlers = []
+    old_listener = _listeners.pop(name, None)
+    if old_listener is not None:
+        old_listener.stop()
     
     # Create formatter
     formatter = logging.Formatter(
@@ -41,15 +53,30 @@ def setup_logger(
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # The logger only enqueues; the listener thread owns the real handlers
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
     
     return logger
 
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Flush queued records before the interpreter exits"""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
 # %% ../nbs/03_logging.ipynb 4
 logger = setup_logger()
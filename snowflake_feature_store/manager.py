@@ -4,26 +4,34 @@
 
 # %% ../nbs/07_manager.ipynb 2
 from __future__ import annotations
-from typing import List, Optional, Dict, Union, Set
+from typing import List, Optional, Dict, Union, Set, Tuple, FrozenSet, Sequence, Protocol, Callable, Deque, Iterable, Iterator, Any
 from dataclasses import dataclass
 import uuid
+from collections import deque
+from collections.abc import MutableMapping
 from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import networkx as nx
 from pathlib import Path
 import json
+import logging
+import os
+import time
+import weakref
 
 from snowflake.ml.feature_store import (
     FeatureStore, Entity, FeatureView, CreationMode
 )
 from snowflake.snowpark import DataFrame
+from snowflake.snowpark.types import StructType
 import snowflake.snowpark.functions as F
 
 # Import our modules
-from .connection import SnowflakeConnection
+from .connection import SnowflakeConnection, _forget_ensured, _run_statements
 from snowflake_feature_store.feature_view import (
-    FeatureViewBuilder, create_feature_view, 
-    FeatureStats, FeatureMonitor
+    FeatureViewBuilder, FeatureStats, FeatureMonitor,
+    compute_stats_batch, detect_drift_batch
 )
 from snowflake_feature_store.transforms import (
     Transform, apply_transforms, TransformConfig,
@@ -39,13 +47,26 @@ from snowflake_feature_store.exceptions import (
 )
 from .logging import logger
 
+# Prefer orjson's C serializer for metrics files when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # %% auto 0
 __all__ = ['FeatureStoreCallback', 'MetricsCallback', 'FeatureStoreManager', 'feature_store_session']
 
 # %% ../nbs/07_manager.ipynb 3
-class FeatureStoreCallback:
-    """Protocol for feature store callbacks"""
+class FeatureStoreCallback(Protocol):
+    """Protocol for feature store callbacks
+    
+    Callbacks don't need to inherit from this; any object with these methods
+    works. They may also define `begin_batch(feature_view)` and `end_batch()`
+    to group the drift notifications from one drift check.
+    """
+    __slots__ = ()
+    
     def on_feature_view_create(
         self, name: str, df: DataFrame, stats: Dict[str, FeatureStats]
     ) -> None: ...
@@ -57,74 +78,230 @@ class FeatureStoreCallback:
     ) -> None: ...
 
 # %% ../nbs/07_manager.ipynb 4
+# UTC stamp used in generated file, dataset and schema names
+_STAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+def _json_default(obj):
+    """Serialize objects the JSON encoders don't handle natively
+    
+    orjson encodes `FeatureStats` dataclasses itself, with the same output
+    as `model_dump()`; the stdlib encoder needs this hook.
+    """
+    if isinstance(obj, FeatureStats):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dump_json(data: Dict, indent: bool = True) -> bytes:
+    """Encode metrics as JSON, with orjson if installed
+    
+    Args:
+        data: Metrics to encode
+        indent: Indent for readability; off for single-line JSON Lines records
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    return json.dumps(data, indent=2 if indent else None, default=_json_default).encode()
+
 class MetricsCallback(FeatureStoreCallback):
     """Callback that logs metrics and statistics"""
+    __slots__ = ('metrics_path', '_batch_view', '_batch_file', '_dir_fd', '__weakref__')
+    
+    # Write metrics files relative to an open directory handle where the OS allows it
+    _USE_DIR_FD = hasattr(os, 'O_DIRECTORY') and os.open in os.supports_dir_fd
+    _WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0)
     
     def __init__(self, metrics_path: Optional[Path] = None):
         self.metrics_path = metrics_path
+        self._batch_view: Optional[str] = None
+        self._batch_file = None
+        self._dir_fd: Optional[int] = None
         if metrics_path:
             metrics_path.mkdir(parents=True, exist_ok=True)
+            if self._USE_DIR_FD:
+                self._dir_fd = os.open(
+                    str(metrics_path), os.O_RDONLY | os.O_DIRECTORY | getattr(os, 'O_CLOEXEC', 0)
+                )
+                weakref.finalize(self, os.close, self._dir_fd)
+    
+    def begin_batch(self, feature_view: str) -> None:
+        """Append drift records to `{feature_view}_drift.jsonl` until `end_batch`
+        
+        The file is only opened once a drift is recorded, so batches without
+        drift leave no file behind.
+        """
+        if self.metrics_path and self._batch_view is None:
+            self._batch_view = feature_view
+    
+    def end_batch(self) -> None:
+        """Flush and close the drift records file, if the batch opened one"""
+        self._batch_view = None
+        if self._batch_file is not None:
+            self._batch_file.close()
+            self._batch_file = None
     
-    def _save_metrics(self, name: str, data: Dict) -> None:
-        """Save metrics to JSON file if path specified"""
+    def _save_metrics(self, name: str, data: Dict, now: Optional[datetime] = None) -> None:
+        """Save metrics to JSON file if path specified
+        
+        Args:
+            name: Metrics name, used in the file name
+            data: JSON-serializable metrics; `FeatureStats` values are allowed
+            now: Event time for the file name, so it matches the payload (default: now)
+        """
         if self.metrics_path:
-            timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
-            file_path = self.metrics_path / f"{name}_{timestamp}.json"
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            timestamp = (now or datetime.now(timezone.utc)).strftime(_STAMP_FORMAT)
+            file_name = f"{name}_{timestamp}.json"
+            # Encode in one pass, then write the file in one call
+            payload = _dump_json(data)
+            if self._dir_fd is None:
+                (self.metrics_path / file_name).write_bytes(payload)
+                return
+            fd = os.open(file_name, self._WRITE_FLAGS, 0o644, dir_fd=self._dir_fd)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
     
     def on_feature_view_create(
         self, name: str, df: DataFrame, stats: Dict[str, FeatureStats]
     ) -> None:
         """Log feature view creation with statistics"""
-        logger.info(f"Created feature view: {name} with {len(df.columns)} features")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Created feature view: %s with %d features", name, len(df.columns))
         
         # Log detailed stats
+        now = datetime.now(timezone.utc)
         stats_data = {
             'name': name,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'feature_stats': {
-                fname: fstats.model_dump()
-                for fname, fstats in stats.items()
-            }
+            'timestamp': now.isoformat(),
+            'feature_stats': stats
         }
-        self._save_metrics(f"{name}_creation", stats_data)
+        self._save_metrics(f"{name}_creation", stats_data, now=now)
         
     def on_entity_create(self, name: str, keys: List[str]) -> None:
         """Log entity creation"""
-        logger.info(f"Created entity: {name} with keys: {keys}")
+        logger.info("Created entity: %s with keys: %s", name, keys)
         
     def on_error(self, error: str) -> None:
         """Log errors"""
-        logger.error(f"Error: {error}")
+        logger.error("Error: %s", error)
         
     def on_drift_detected(
         self, feature_view: str, feature: str, metrics: Dict[str, float]
     ) -> None:
         """Log feature drift detection"""
-        logger.warning(
-            f"Drift detected in {feature_view}.{feature}: {metrics}"
-        )
-        self._save_metrics(
-            f"{feature_view}_{feature}_drift",
-            {
-                'feature_view': feature_view,
-                'feature': feature,
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'metrics': metrics
-            }
-        )
+        logger.warning("Drift detected in %s.%s: %s", feature_view, feature, metrics)
+        now = datetime.now(timezone.utc)
+        record = {
+            'feature_view': feature_view,
+            'feature': feature,
+            'timestamp': now.isoformat(),
+            'metrics': metrics
+        }
+        if self._batch_view is not None:
+            if self._batch_file is None:
+                self._batch_file = open(
+                    self.metrics_path / f"{self._batch_view}_drift.jsonl", 'ab', buffering=1 << 20
+                )
+            # One line per drifted feature; written out when the batch ends
+            self._batch_file.write(_dump_json(record, indent=False) + b"\n")
+        else:
+            self._save_metrics(f"{feature_view}_{feature}_drift", record, now=now)
 
 # %% ../nbs/07_manager.ipynb 5
+@lru_cache(maxsize=4096)
+def _quote(name: str) -> str:
+    """Quote an identifier for the feature store's dataset API"""
+    return f'"{name}"'
+
+def _short_id(n: int = 8) -> str:
+    """Random hex suffix for generated object names"""
+    return uuid.uuid4().hex[:n]
+
+@contextmanager
+def _batched_callbacks(callbacks: Sequence[FeatureStoreCallback], feature_view: str):
+    """Let callbacks that support batching group one drift check's notifications"""
+    batching = [cb for cb in callbacks if hasattr(cb, 'begin_batch')]
+    for cb in batching:
+        cb.begin_batch(feature_view)
+    try:
+        yield
+    finally:
+        for cb in batching:
+            cb.end_batch()
+
+@dataclass
+class _FeatureViewState:
+    """Everything the manager tracks for one registered feature view"""
+    __slots__ = ('config', 'view', 'entity', 'stats', 'transforms')
+    config: FeatureViewConfig
+    view: FeatureView
+    entity: Entity
+    stats: Dict[str, FeatureStats]
+    transforms: List[Transform]
+
+class _ViewField(MutableMapping):
+    """Dict-like view of one field of every registered feature view's state
+    
+    Reads and writes go straight to the manager's per-view records, so there
+    is no second copy to keep in sync. Entries can be replaced for registered
+    views only; new views are added with `add_feature_view`.
+    """
+    __slots__ = ('_views', '_field', '_skip_empty')
+    
+    def __init__(self, views: Dict[str, _FeatureViewState], field: str, skip_empty: bool = False):
+        self._views = views
+        self._field = field
+        self._skip_empty = skip_empty  # Hide views whose value is empty
+    
+    def __getitem__(self, name: str) -> Any:
+        value = getattr(self._views[name], self._field)
+        if self._skip_empty and not value:
+            raise KeyError(name)
+        return value
+    
+    def __setitem__(self, name: str, value: Any) -> None:
+        state = self._views.get(name)
+        if state is None:
+            raise KeyError(f"Feature view {name} is not registered; add it with add_feature_view")
+        setattr(state, self._field, value)
+    
+    def __delitem__(self, name: str) -> None:
+        raise TypeError(f"Can't remove {self._field} for feature view {name}; it is part of its registration")
+    
+    def __iter__(self) -> Iterator[str]:
+        if not self._skip_empty:
+            return iter(self._views)
+        return (name for name, state in self._views.items() if getattr(state, self._field))
+    
+    def __len__(self) -> int:
+        if not self._skip_empty:
+            return len(self._views)
+        return sum(1 for _ in self)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
 class FeatureStoreManager:
     """Manages feature store operations with monitoring and dependency tracking"""
+    __slots__ = (
+        'connection', 'drift_parallelism', 'feature_store', 'entities', '_views',
+        'dependencies', '_dep_version', '_dep_cache', '_recent_deps', '_callbacks',
+        'overwrite', '_on_entity_create', '_on_feature_view_create', '_on_error',
+        '_on_drift_detected', '__weakref__'
+    )
     
     def __init__(
         self,
         connection: SnowflakeConnection,
         callbacks: Optional[List[FeatureStoreCallback]] = None,
         metrics_path: Optional[Union[str, Path]] = None,
-        overwrite: bool = False
+        overwrite: bool = False,
+        drift_parallelism: int = 16
     ):
         """Initialize feature store manager
         
@@ -133,8 +310,11 @@ class FeatureStoreManager:
             callbacks: Optional callbacks for monitoring
             metrics_path: Optional path to save metrics
             overwrite: Whether to overwrite existing features
+            drift_parallelism: Max concurrent per-feature stats queries when
+                the batched stats query fails
         """
         self.connection = connection
+        self.drift_parallelism = max(1, drift_parallelism)
         self.feature_store = FeatureStore(
             session=self.connection.session,
             database=self.connection.database,
@@ -145,22 +325,138 @@ class FeatureStoreManager:
         
         # Initialize storage
         self.entities: Dict[str, Entity] = {}
-        self.feature_views: Dict[str, FeatureView] = {}
-        self.feature_configs: Dict[str, FeatureViewConfig] = {}
-        self.feature_stats: Dict[str, Dict[str, FeatureStats]] = {}
-        self.feature_transforms: Dict[str, List[Transform]] = {}  # Add this line
-        self.dependencies = nx.DiGraph()
+        # One record per feature view, so a lookup by name gets all of it
+        self._views: Dict[str, _FeatureViewState] = {}
+        # Dependency graph as adjacency sets: node -> nodes it points to
+        self.dependencies: Dict[str, Set[str]] = {}
+        # Dependency lookups, tagged with the graph version they were computed at
+        self._dep_version = 0
+        self._dep_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        # Most recently added edges, for debug logging without copying the graph
+        self._recent_deps: Deque[Tuple[str, str]] = deque(maxlen=512)
         
-        # Setup callbacks
-        self.callbacks = callbacks or []
+        # Setup callbacks; kept as a tuple so notifying is a plain iteration
+        callbacks = list(callbacks or [])
         if metrics_path:
-            self.callbacks.append(
+            callbacks.append(
                 MetricsCallback(Path(metrics_path))
             )
+        self._callbacks: Tuple[FeatureStoreCallback, ...] = tuple(callbacks)
+        self._rebuild_dispatch()
         
         self.overwrite = overwrite
         logger.info("FeatureStoreManager initialized")
             
+    @property
+    def callbacks(self) -> Tuple[FeatureStoreCallback, ...]:
+        """Registered callbacks; use `add_callback` to register more
+        
+        This is a tuple, so it can't be appended to in place; assigning a new
+        list of callbacks replaces them all.
+        """
+        return self._callbacks
+    
+    @callbacks.setter
+    def callbacks(self, callbacks: Iterable[FeatureStoreCallback]) -> None:
+        self._callbacks = tuple(callbacks)
+        self._rebuild_dispatch()
+    
+    def add_callback(self, callback: FeatureStoreCallback) -> FeatureStoreManager:
+        """Register a callback for feature store events
+        
+        Returns:
+            Self for method chaining
+        """
+        self._callbacks = (*self._callbacks, callback)
+        self._rebuild_dispatch()
+        return self
+    
+    def _rebuild_dispatch(self) -> None:
+        """Bind each event's callback methods once, so notifying skips the lookups"""
+        self._on_entity_create: Tuple[Callable, ...] = tuple(cb.on_entity_create for cb in self._callbacks)
+        self._on_feature_view_create: Tuple[Callable, ...] = tuple(cb.on_feature_view_create for cb in self._callbacks)
+        self._on_error: Tuple[Callable, ...] = tuple(cb.on_error for cb in self._callbacks)
+        self._on_drift_detected: Tuple[Callable, ...] = tuple(cb.on_drift_detected for cb in self._callbacks)
+    
+    def _notify_error(self, error_msg: str) -> None:
+        """Report an error to every callback"""
+        for on_error in self._on_error:
+            on_error(error_msg)
+    
+    def _compute_stats(
+        self,
+        df: DataFrame,
+        monitors: Dict[str, FeatureMonitor],
+        run_ts: datetime,
+        skip_failed: bool = False
+    ) -> Dict[str, FeatureStats]:
+        """Compute stats for all monitored features, in one query when possible
+        
+        Args:
+            df: DataFrame containing the features
+            monitors: Monitor for each feature column, by column name
+            run_ts: When the stats were taken
+            skip_failed: Whether a feature that fails on its own is skipped
+                instead of raising
+        """
+        if not monitors:
+            return {}
+        try:
+            return compute_stats_batch(df, monitors, run_ts)
+        except Exception as e:
+            # Fall back to one query per feature so a bad column is isolated
+            logger.warning("Batched stats failed, computing per feature: %s", e)
+        return self._compute_stats_per_feature(df, monitors, run_ts, skip_failed)
+    
+    def _compute_stats_per_feature(
+        self,
+        df: DataFrame,
+        monitors: Dict[str, FeatureMonitor],
+        run_ts: datetime,
+        skip_failed: bool = False
+    ) -> Dict[str, FeatureStats]:
+        """Compute stats with one concurrent query per feature (see `_compute_stats`)"""
+        def _compute_one(feature_name: str, monitor: FeatureMonitor):
+            try:
+                return feature_name, monitor.compute_stats(df, feature_name, timestamp=run_ts)
+            except Exception as e:
+                if not skip_failed:
+                    raise
+                logger.warning("Skipping stats for %s: %s", feature_name, e)
+                return feature_name, None
+        
+        # Each query waits on Snowflake, so overlap them
+        workers = min(self.drift_parallelism, len(monitors))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_compute_one, monitors, monitors.values()))
+        return {
+            feature_name: stats for feature_name, stats in results
+            if stats is not None
+        }
+    
+    @property
+    def feature_views(self) -> MutableMapping[str, FeatureView]:
+        """Registered feature views by name, read from the per-view records"""
+        return _ViewField(self._views, 'view')
+    
+    @property
+    def feature_configs(self) -> MutableMapping[str, FeatureViewConfig]:
+        """Feature view configurations by name, read from the per-view records"""
+        return _ViewField(self._views, 'config')
+    
+    @property
+    def feature_stats(self) -> MutableMapping[str, Dict[str, FeatureStats]]:
+        """Baseline feature statistics by feature view name
+        
+        Assigning to a registered view's entry replaces its baseline.
+        """
+        return _ViewField(self._views, 'stats')
+    
+    @property
+    def feature_transforms(self) -> MutableMapping[str, List[Transform]]:
+        """Transforms applied to each feature view's source data (views with any)"""
+        return _ViewField(self._views, 'transforms', skip_empty=True)
+    
     def add_entity(
         self, 
         name: str, 
@@ -194,15 +490,14 @@ class FeatureStoreManager:
             if tags:
                 for key, value in tags.items():
                     self.feature_store.set_tag(entity, key, value)
-            
-            for cb in self.callbacks:
-                cb.on_entity_create(name, join_keys)
                 
         except Exception as e:
             error_msg = f"Error creating entity {name}: {str(e)}"
-            for cb in self.callbacks:
-                cb.on_error(error_msg)
+            self._notify_error(error_msg)
             raise EntityError(error_msg)
+        
+        for on_entity_create in self._on_entity_create:
+            on_entity_create(name, join_keys)
             
         return self
 
@@ -213,7 +508,8 @@ class FeatureStoreManager:
         df: DataFrame,
         entity_name: str,
         transforms: Optional[List[Transform]] = None,
-        collect_stats: bool = True
+        collect_stats: bool = True,
+        check_ranges: bool = False
     ) -> FeatureView:
         """Add feature view to feature store with monitoring
         
@@ -222,29 +518,30 @@ class FeatureStoreManager:
             df: Source DataFrame
             entity_name: Entity name
             transforms: Optional transformations to apply
-            collect_stats: Whether to collect feature statistics
+            collect_stats: Whether to collect detailed feature statistics
+                (unique count, min/max, mean/std) for the drift baseline;
+                without them the baseline only has row and null counts
+            check_ranges: Fail when a feature with `range_check` has values
+                outside `[min_value, max_value]`
         """
         try:
+            # Get entity first; it's a local lookup, so fail before any schema call
+            entity = self.entities.get(entity_name)
+            if not entity:
+                raise EntityError(f"Entity {entity_name} not found")
+                
             # Validate schema only (no execution)
             self._validate_schema(df)
             
             # Apply transforms if provided
             if transforms:
-                self.feature_transforms[config.name] = transforms
                 df = apply_transforms(df, transforms)
                 
-            # Get entity
-            entity = self.entities.get(entity_name)
-            if not entity:
-                raise EntityError(f"Entity {entity_name} not found")
-                
-            # Create feature view
-            feature_view = create_feature_view(
-                config=config,
-                feature_df=df,
-                entities=entity,
-                collect_stats=collect_stats
+            # Create feature view; the builder's validation stats become the baseline
+            builder = FeatureViewBuilder(
+                config, df, entity, collect_stats=collect_stats, check_ranges=check_ranges
             )
+            feature_view = builder.build()
             
             # Register feature view
             registered_view = self.feature_store.register_feature_view(
@@ -254,32 +551,37 @@ class FeatureStoreManager:
                 overwrite=self.overwrite
             )
             
-            # Store view, config, and compute initial stats
-            self.feature_views[config.name] = registered_view
-            self.feature_configs[config.name] = config
-
             # Update dependency graph
             self._update_dependencies(config)
             
-            # Compute and store statistics
-            builder = FeatureViewBuilder(config, df, entity)
-            stats = {
-                name: monitor.compute_stats(df, name)
-                for name, monitor in builder.monitors.items()
-            }
-            self.feature_stats[config.name] = stats
-            
-            # Notify callbacks
-            for cb in self.callbacks:
-                cb.on_feature_view_create(config.name, df, stats)
-                
-            return registered_view
+            # Reuse the builder's stats rather than aggregating the data again
+            try:
+                stats = builder.feature_stats
+            except Exception as e:
+                logger.warning("Batched stats failed, computing per feature: %s", e)
+                stats = self._compute_stats_per_feature(
+                    builder.feature_df, builder.monitors, datetime.now(timezone.utc)
+                )
             
         except Exception as e:
             error_msg = f"Error creating feature view {config.name}: {str(e)}"
-            for cb in self.callbacks:
-                cb.on_error(error_msg)
+            self._notify_error(error_msg)
             raise FeatureViewError(error_msg)
+        
+        # Store view, config, entity, stats and transforms together
+        self._views[config.name] = _FeatureViewState(
+            config=config,
+            view=registered_view,
+            entity=entity,
+            stats=stats,
+            transforms=list(transforms or [])
+        )
+        
+        # Notify callbacks
+        for on_feature_view_create in self._on_feature_view_create:
+            on_feature_view_create(config.name, df, stats)
+            
+        return registered_view
     
     def check_feature_drift(
         self,
@@ -287,106 +589,111 @@ class FeatureStoreManager:
         new_data: DataFrame
     ) -> Dict[str, Dict[str, float]]:
         """Check for feature drift in new data"""
-        drift_results = {}
-        
         try:
-            # Get stored stats
-            stored_stats = self.feature_stats.get(feature_view_name)
-            if not stored_stats:
+            # Get stored stats, config and transforms in one lookup
+            state = self._views.get(feature_view_name)
+            if state is None or not state.stats:
                 raise FeatureViewError(
                     f"No baseline stats for feature view {feature_view_name}"
                 )
-            
-            # Get feature view configuration
-            config = self.feature_configs.get(feature_view_name)
-            if not config:
-                raise FeatureViewError(f"Feature view config {feature_view_name} not found")
+            stored_stats, config, transforms = state.stats, state.config, state.transforms
                 
             # Apply stored transforms to new data
-            transforms = self.feature_transforms.get(feature_view_name, [])
             if transforms:
-                logger.info(f"Applying {len(transforms)} transforms to new data")
+                logger.info("Applying %d transforms to new data", len(transforms))
                 new_data_with_features = apply_transforms(new_data, transforms)
             else:
                 logger.info("No transforms to apply")
                 new_data_with_features = new_data
             
-            # Check drift for each feature
-            for feature_name, baseline_stats in stored_stats.items():
-                try:
-                    # Get the original feature config if it exists
-                    feature_config = config.features.get(feature_name)
-                    
-                    # Create monitor with existing config or default
-                    monitor = FeatureMonitor(
-                        feature_config or FeatureConfig(
-                            name=feature_name,
-                            description=f"Temporary monitor for {feature_name}"
-                        ),
-                        collect_detailed_stats=True
+            # Monitor each feature present in the new data
+            available_columns = {
+                field.name.upper() for field in new_data_with_features.schema.fields
+            }
+            monitors = {}
+            for feature_name in stored_stats:
+                if feature_name.upper() not in available_columns:
+                    logger.warning(
+                        "Skipping drift detection for %s: column not in new data", feature_name
                     )
-                    
-                    # Compute current stats and detect drift
-                    current_stats = monitor.compute_stats(new_data_with_features, feature_name)
-                    monitor.set_baseline(baseline_stats)
-                    drift_metrics = monitor.detect_drift(current_stats)
-                    
-                    # Check if drift is significant
-                    if any(abs(v) > 0.1 for v in drift_metrics.values()):
-                        drift_results[feature_name] = drift_metrics
-                        # Notify callbacks
-                        for cb in self.callbacks:
-                            cb.on_drift_detected(
-                                feature_view_name, feature_name, drift_metrics
-                            )
-                            
-                except Exception as e:
-                    logger.warning(f"Skipping drift detection for {feature_name}: {str(e)}")
                     continue
+                # Create monitor with existing config or default
+                monitors[feature_name] = FeatureMonitor(
+                    config.features.get(feature_name) or FeatureConfig(
+                        name=feature_name,
+                        description=f"Temporary monitor for {feature_name}"
+                    ),
+                    collect_detailed_stats=True
+                )
+            
+            # Compute current stats for all features in one query
+            current_stats = self._compute_stats(
+                new_data_with_features, monitors, datetime.now(timezone.utc), skip_failed=True
+            )
+            
+            # Detect significant drift across all features in one pass
+            drift_results = detect_drift_batch(stored_stats, current_stats, threshold=0.1)
+            with _batched_callbacks(self._callbacks, feature_view_name):
+                for feature_name, drift_metrics in drift_results.items():
+                    # Notify callbacks
+                    for on_drift_detected in self._on_drift_detected:
+                        on_drift_detected(feature_view_name, feature_name, drift_metrics)
             
             return drift_results
             
         except Exception as e:
             error_msg = f"Error checking drift for {feature_view_name}: {str(e)}"
-            for cb in self.callbacks:
-                cb.on_error(error_msg)
+            self._notify_error(error_msg)
             raise FeatureViewError(error_msg)
         
-    def get_feature_dependencies(self, feature_view_name: str) -> Set[str]:
-        """Get dependencies for a feature view"""
-        try:
-            return nx.descendants(self.dependencies, feature_view_name)
-        except Exception as e:
-            raise FeatureViewError(
-                f"Error getting dependencies for {feature_view_name}: {str(e)}"
-            )
-    
     def _update_dependencies(self, config: FeatureViewConfig) -> None:
         """Update dependency graph with new feature view"""
+        # Invalidate cached dependency lookups
+        self._dep_version += 1
         try:
             # Add the feature view as a node
-            self.dependencies.add_node(config.name)
+            view_edges = self.dependencies.setdefault(config.name, set())
+            n_added = 0
             
             # Track dependencies from transforms
             for feature_name, feature_config in config.features.items():
-                # Add each feature as a node
+                # Add each feature as a node, with an edge from the feature view
                 feature_node = f"{config.name}.{feature_name}"
-                self.dependencies.add_node(feature_node)
-                
-                # Add edge from feature view to feature
-                self.dependencies.add_edge(config.name, feature_node)
+                feature_edges = self.dependencies.setdefault(feature_node, set())
+                view_edges.add(feature_node)
+                self._recent_deps.append((config.name, feature_node))
+                n_added += 1
                 
                 # Add dependencies between features
                 if feature_config.dependencies:
                     for dep in feature_config.dependencies:
-                        self.dependencies.add_edge(feature_node, dep)
+                        self.dependencies.setdefault(dep, set())
+                        feature_edges.add(dep)
+                        self._recent_deps.append((feature_node, dep))
+                        n_added += 1
                         
-            logger.debug(
-                f"Updated dependencies for {config.name}: "
-                f"{list(self.dependencies.edges)}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                # Log only this update's edges (up to the last few), not the whole graph
+                tail = list(self._recent_deps)[-min(n_added, 4):] if n_added else []
+                logger.debug(
+                    "Added %d edges for %s (recent tail: %r)", n_added, config.name, tail
+                )
         except Exception as e:
-            logger.error(f"Error updating dependencies: {str(e)}")
+            logger.error("Error updating dependencies: %s", e)
+
+    def _descendants(self, node: str) -> Set[str]:
+        """Every node reachable from `node` in the dependency graph"""
+        if node not in self.dependencies:
+            raise ValueError(f"The node {node} is not in the dependency graph")
+        seen = set()
+        stack = [node]
+        while stack:
+            for dep in self.dependencies[stack.pop()]:
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        seen.discard(node)
+        return seen
 
     def get_feature_dependencies(self, feature_view_name: str) -> Set[str]:
         """Get dependencies for a feature view
@@ -397,9 +704,12 @@ class FeatureStoreManager:
         Returns:
             Set of dependent feature names
         """
+        cached = self._dep_cache.get(feature_view_name)
+        if cached is not None and cached[0] == self._dep_version:
+            return set(cached[1])
         try:
             # Get all descendants (dependencies) from the graph
-            deps = nx.descendants(self.dependencies, feature_view_name)
+            deps = self._descendants(feature_view_name)
             
             # Filter out internal feature nodes
             feature_deps = {
@@ -407,9 +717,8 @@ class FeatureStoreManager:
                 if '.' in dep  # Only include actual feature views
             }
             
-            logger.info(
-                f"Dependencies for {feature_view_name}: {feature_deps}"
-            )
+            logger.info("Dependencies for %s: %s", feature_view_name, feature_deps)
+            self._dep_cache[feature_view_name] = (self._dep_version, frozenset(feature_deps))
             return feature_deps
             
         except Exception as e:
@@ -418,10 +727,32 @@ class FeatureStoreManager:
             )
 
     
-    def _validate_schema(self, df: DataFrame) -> None:
-        """Validate DataFrame schema without execution"""
-        if not df.schema:
+    def _validate_schema(self, df: DataFrame) -> StructType:
+        """Validate DataFrame schema without execution
+        
+        Returns:
+            The DataFrame's schema, so callers don't fetch it again
+        """
+        schema = df.schema
+        if not schema.fields:
             raise ValidationError("DataFrame has no schema")
+        return schema
+            
+    def _view_from_config(self, config: FeatureViewConfig) -> FeatureView:
+        """Get a registered view by a config's name/version"""
+        return self.feature_store.get_feature_view(config.name, version=config.version)
+    
+    def _view_from_ref(self, ref: str) -> FeatureView:
+        """Get a registered view from a "name/version" string reference"""
+        name, version = ref.split('/')
+        return self.feature_store.get_feature_view(name, version)
+    
+    # How get_features turns each kind of feature view reference into a view
+    _VIEW_RESOLVERS = {
+        FeatureView: lambda self, fv: fv,
+        FeatureViewConfig: _view_from_config,
+        str: _view_from_ref
+    }
             
     def get_features(
         self,
@@ -434,45 +765,38 @@ class FeatureStoreManager:
     ) -> DataFrame:
         """Get features for training or inference"""
         try:
-            # Debug information
-            logger.info(f"Spine DataFrame columns: {spine_df.columns}")
-            logger.info(f"Spine DataFrame schema: {spine_df.schema}")
+            # Debug information; rendering the schema is a metadata call
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Spine DataFrame columns: %s", spine_df.columns)
+                logger.debug("Spine DataFrame schema: %s", spine_df.schema)
 
             views = []
             for fv in feature_views:
-                if isinstance(fv, FeatureView):
-                    # Direct FeatureView object
-                    views.append(fv)
-                elif isinstance(fv, FeatureViewConfig):
-                    # Config object - get view by name/version
-                    view = self.feature_store.get_feature_view(
-                        fv.name, version=fv.version
+                resolve = self._VIEW_RESOLVERS.get(type(fv))
+                if resolve is None:
+                    # Subclasses miss the exact-type lookup
+                    resolve = next(
+                        (r for t, r in self._VIEW_RESOLVERS.items() if isinstance(fv, t)), None
                     )
-                    views.append(view)
-                elif isinstance(fv, str):
-                    # String reference "name/version"
-                    name, version = fv.split('/')
-                    view = self.feature_store.get_feature_view(name, version)
-                    views.append(view)
-                else:
+                if resolve is None:
                     raise ValueError(f"Unsupported feature view type: {type(fv)}")
+                views.append(resolve(self, fv))
             
             if dataset_name is None:
-                timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
-                unique_id = str(uuid.uuid4())[:8]
-                dataset_name = f"DATASET_{timestamp}_{unique_id}"
+                dataset_name = f"DATASET_{time.strftime(_STAMP_FORMAT, time.gmtime())}_{_short_id()}"
 
             # If label_cols are provided, ensure they're properly quoted
             if label_cols:
-                label_cols = [f'"{col}"' for col in label_cols]
+                label_cols = list(map(_quote, label_cols))
                 
             # Ensure timestamp col is quoted
             if spine_timestamp_col:
-                spine_timestamp_col = f'"{spine_timestamp_col}"'
+                spine_timestamp_col = _quote(spine_timestamp_col)
 
-            logger.info(f"Generating dataset with name: {dataset_name}")
-            logger.info(f"Label columns: {label_cols}")
-            logger.info(f"Timestamp column: {spine_timestamp_col}")
+            logger.info(
+                "Generating dataset with name: %s (label columns: %s, timestamp column: %s)",
+                dataset_name, label_cols, spine_timestamp_col
+            )
                 
             dataset = self.feature_store.generate_dataset(
                 name=dataset_name,
@@ -487,13 +811,12 @@ class FeatureStoreManager:
             
         except Exception as e:
             error_msg = f"Error generating dataset: {str(e)}"
-            for cb in self.callbacks:
-                cb.on_error(error_msg)
+            self._notify_error(error_msg)
             raise FeatureStoreException(error_msg)
 
 
 
-# %% ../nbs/07_manager.ipynb 6
+# %% ../nbs/07_manager.ipynb 8
 @contextmanager
 def feature_store_session(
     connection: SnowflakeConnection, 
@@ -511,21 +834,16 @@ def feature_store_session(
         cleanup: Whether to cleanup schema after use (keyword only)
     """
     schema = schema_name or (
-        f"FEATURE_STORE_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
-        f"_{uuid.uuid4().hex[:8]}"
+        f"FEATURE_STORE_{time.strftime(_STAMP_FORMAT, time.gmtime())}_{_short_id()}"
     )
     original_schema = connection.schema
     
     try:
-        # Create schema
-        connection.session.sql(
-            f"CREATE SCHEMA IF NOT EXISTS {connection.database}.{schema}"
-        ).collect()
-        
-        # Set schema as current
-        connection.session.sql(
+        # Create schema and set it as current in one round trip
+        _run_statements(connection.session, [
+            f"CREATE SCHEMA IF NOT EXISTS {connection.database}.{schema}",
             f"USE SCHEMA {connection.database}.{schema}"
-        ).collect()
+        ])
         connection.schema = schema
         
         # Create and yield manager with metrics path
@@ -538,21 +856,27 @@ def feature_store_session(
         
     finally:
         if cleanup:
+            drop_sql = f"DROP SCHEMA IF EXISTS {connection.database}.{schema} CASCADE"
+            restore_sql = f"USE SCHEMA {connection.database}.{original_schema}"
+            # The schema is about to be dropped; don't let get_connection assume it exists
+            _forget_ensured(connection.session, connection.database, schema)
             try:
-                # Cleanup schema and all objects
-                connection.session.sql(
-                    f"DROP SCHEMA IF EXISTS {connection.database}.{schema} CASCADE"
-                ).collect()
-                logger.info(f"Cleaned up schema {schema}")
-            except Exception as e:
-                logger.error(f"Cleanup failed: {str(e)}")
-            
-            # Restore original schema
-            try:
-                connection.session.sql(
-                    f"USE SCHEMA {connection.database}.{original_schema}"
-                ).collect()
+                # Cleanup schema and all objects, then restore original schema
+                _run_statements(connection.session, [drop_sql, restore_sql])
+                logger.info("Cleaned up schema %s", schema)
                 connection.schema = original_schema
             except Exception as e:
-                logger.error(f"Failed to restore original schema: {str(e)}")
+                # Retry step by step so a failed drop still restores the schema
+                logger.warning("Batched cleanup failed, retrying each step: %s", e)
+                try:
+                    connection.session.sql(drop_sql).collect()
+                    logger.info("Cleaned up schema %s", schema)
+                except Exception as e:
+                    logger.error("Cleanup failed: %s", e)
+                
+                try:
+                    connection.session.sql(restore_sql).collect()
+                    connection.schema = original_schema
+                except Exception as e:
+                    logger.error("Failed to restore original schema: %s", e)
 